@@ -134,7 +134,7 @@ class ChartPerformanceTest:
             
             avg_time = (end_time - start_time) / 50
             plot_data = optimizer.get_optimized_data_points()
-            optimized_points = len(plot_data[0]) if plot_data and plot_data[0] else 0
+            optimized_points = len(plot_data[0]) if plot_data else 0
             reduction = ((data_size - optimized_points) / data_size * 100) if data_size > 0 else 0
             
             print(f"  Original points: {data_size}")
@@ -8,6 +8,7 @@ import sys
 import os
 import time
 import json
+import csv
 import tempfile
 import shutil
 from unittest.mock import Mock, patch, MagicMock
@@ -414,31 +415,42 @@ class TestHeaterMonitorSystem(unittest.TestCase):
                 mock_join.return_value = self.config_path
                 
                 app = HeaterTestSystem()
-                
-                # Create auto-save manager
-                with patch('heater_monitor.LOGS_DIR', self.test_dir):
-                    auto_save = AutoSaveManager(app)
-                    
-                    # Add test data
-                    app.data_log.append(["test_data"] * 19)
-                    
+            
+            # Create auto-save manager writing to the test directory
+            auto_save = AutoSaveManager(app, self.test_dir)
+            
 <<<<<<< HEAD
-                    # Add test data to app
-                    app.data_log = [["12:00:00", "2", "1", "45", "55", "0", "0", "0", "0", "4.8", "0.2", "4.9", "4.7", "Heat", "None", "30", "NORMAL", "ON", "STANDBY"]]
-                    
-                    # Test auto-save
-                    auto_save_path = auto_save.auto_save_data()
+            # Stream test rows the way update_data does
+            test_rows = [
+                ["12:00:00", "2", "1", "45", "55", "0", "0", "0", "0", "4.8", "0.2", "4.9", "4.7", "Heat", "None", "30", "NORMAL", "ON", "STANDBY"],
+                ["12:00:01", "2", "1", "46", "55", "0", "0", "0", "0", "4.8", "0.2", "4.9", "4.7", "Heat", "Heat", "31", "NORMAL", "ON", "STANDBY"],
+            ]
+            for row in test_rows:
+                auto_save.append_row(row)
+            
+            # Test auto-save
+            auto_save_path = auto_save.auto_save_data()
+            self.assertIsNotNone(auto_save_path)
 =======
-                    # Test auto-save
-                    auto_save.auto_save_data()
+            # Stream test rows the way update_data does
+            test_rows = [["12:00:00"] + ["test_data"] * 18, ["12:00:01"] + ["test_data"] * 18]
+            for row in test_rows:
+                auto_save.append_row(row)
+            
+            # Test auto-save
+            auto_save.auto_save_data()
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
-                    
-                    # Check if file was created
-                    files = os.listdir(self.test_dir)
-                    excel_files = [f for f in files if f.endswith('.xlsx')]
-                    self.assertGreater(len(excel_files), 0)
-                
-                print("✅ Auto-save functionality working")
+            auto_save.close()
+            
+            # Check the session CSV was created with the streamed rows
+            csv_files = [f for f in os.listdir(self.test_dir) if f.endswith('.csv')]
+            self.assertEqual(len(csv_files), 1)
+            with open(os.path.join(self.test_dir, csv_files[0]), newline='', encoding='utf-8') as f:
+                saved_rows = list(csv.reader(f))
+            self.assertEqual(len(saved_rows), len(test_rows) + 1)  # Header + streamed rows
+            self.assertEqual([row[0] for row in saved_rows[1:]], [row[0] for row in test_rows])
+            
+            print("✅ Auto-save functionality working")
                 
         except Exception as e:
             self.fail(f"❌ Auto-save test failed: {e}")
@@ -455,7 +467,7 @@ class TestHeaterMonitorSystem(unittest.TestCase):
                 optimizer = PerformanceOptimizer(app)
                 
                 # Simulate continuous operation
-                start_memory = optimizer.get_memory_usage()
+                start_memory = optimizer.get_memory_usage(max_age=0)
                 
                 # Add large amount of data rapidly
                 for cycle in range(10):
@@ -472,7 +484,7 @@ class TestHeaterMonitorSystem(unittest.TestCase):
                     if cycle % 3 == 0:
                         optimizer.perform_periodic_cleanup()
                 
-                end_memory = optimizer.get_memory_usage()
+                end_memory = optimizer.get_memory_usage(max_age=0)
                 memory_growth = end_memory - start_memory
                 
                 # Memory growth should be controlled
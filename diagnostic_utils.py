@@ -0,0 +1,89 @@
+"""
+Shared helpers for the terminal diagnostic scripts
+Imports, fixtures, CPU sampling and report formatting used by more than one diagnostic
+"""
+
+import sys
+import importlib
+import functools
+
+# Class definitions sit near the top of the test file - only this much is scanned
+CLASS_SCAN_BYTES = 16384
+
+_BAR = '=' * 60
+
+# Import errors already seen - a module that failed once is not executed again
+_import_failures = {}
+
+def cached_import(module_name, attr_name=None):
+    """Module (or one of its attributes) from sys.modules, importing only on a miss"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        if module_name in _import_failures:
+            raise _import_failures[module_name]
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            _import_failures[module_name] = e
+            raise
+    if attr_name is None:
+        return module
+    try:
+        return getattr(module, attr_name)
+    except AttributeError as e:
+        raise ImportError(f"cannot import name '{attr_name}' from '{module_name}'") from e
+
+def read_file_head(path, size=CLASS_SCAN_BYTES):
+    """First size bytes of path, or None when the file is missing"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(size)
+    except FileNotFoundError:
+        return None
+
+class MockApp:
+    """Stand-in app with numpy buffers like the chart ring buffers - 1000 data points"""
+    def __init__(self):
+        import numpy as np
+        self.timestamps = np.arange(1000, dtype=np.float64)
+        self.heater1_data = np.full(1000, 25.0)
+        self.heater2_data = np.full(1000, 30.0)
+
+@functools.lru_cache(maxsize=None)
+def get_mock_app():
+    """Shared MockApp fixture - built once on first use"""
+    return MockApp()
+
+# This process, as primed by prime_cpu_sample()
+_cpu_process = None
+
+def prime_cpu_sample():
+    """Start the system-wide and own-process CPU counters"""
+    global _cpu_process
+    import psutil
+    _cpu_process = psutil.Process()
+    _cpu_process.cpu_percent(interval=None)
+    psutil.cpu_percent(interval=None)
+
+def background_cpu_percent():
+    """System CPU usage since prime_cpu_sample(), excluding the diagnostic's own work"""
+    import psutil
+    total = psutil.cpu_percent(interval=None)
+    if _cpu_process is None:
+        return total
+    own = _cpu_process.cpu_percent(interval=None) / (psutil.cpu_count() or 1)
+    return max(0.0, total - own)
+
+def problem_categories(problems, keywords):
+    """Keywords that occur in any problem message - each message is lowercased once"""
+    found = set()
+    for problem in problems:
+        lowered = problem.lower()
+        found.update(keyword for keyword in keywords if keyword in lowered)
+    return found
+
+def print_header(title, problem_num=None):
+    """Print diagnostic section header"""
+    if problem_num:
+        title = f"Problem {problem_num}: {title}"
+    print(f"\n{_BAR}\n🔍 {title}\n{_BAR}")
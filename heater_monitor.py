@@ -4,11 +4,16 @@
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 import sys
 import csv
+import io
 import time
 import os
 import json
 import math
 import gc
+import re
+import itertools
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
 <<<<<<< HEAD
 # pyright: reportMissingImports=false
@@ -18,14 +23,14 @@ from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
     QLabel, QPushButton, QHBoxLayout, QHeaderView, QSplitter, QStyleFactory, QAbstractItemView,
     QCheckBox, QSpinBox, QDoubleSpinBox, QComboBox, QDateEdit, QFileDialog, QMessageBox,
-    QDialog, QLineEdit
+    QDialog, QLineEdit, QTableView, QMenu
 )
 <<<<<<< HEAD
 # pyright: reportMissingImports=false
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
 # pyright: reportMissingImports=false
 =======
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 from PyQt6.QtGui import QColor, QBrush, QPalette, QFont
 
@@ -36,6 +41,11 @@ try:
 except ImportError:
     HAS_PERFORMANCE_OPT = False
     print("⚠️ Performance optimization module not found - running without optimizations")
+try:
+    # pyright: reportMissingModuleSource=false
+    import psutil
+except ImportError:
+    psutil = None  # Memory readout is skipped without it
 try:
 <<<<<<< HEAD
     # pyright: reportMissingImports=false
@@ -75,6 +85,18 @@ import pandas as pd
 import serial
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 import serial.tools.list_ports
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+try:
+    import pyqtgraph as pg
+    pg.setConfigOptions(useOpenGL=True, antialias=False)
+    HAS_PYQTGRAPH = True
+except Exception:
+    pg = None
+    HAS_PYQTGRAPH = False
 
 DEVICE_NAME = "cDAQ1Mod1"
 
@@ -87,6 +109,34 @@ CHANNELS = {
     'Heater1': 'ai4',
     'Heater2': 'ai5'
 }
+CHANNEL_NAMES = tuple(CHANNELS)  # Channel order, built once (dicts keep insertion order)
+
+# Hardware-timed acquisition - the driver buffers samples, each read drains the buffer
+DAQ_SAMPLE_RATE = 1000       # Samples per second per channel
+DAQ_BUFFER_SAMPLES = 10000   # Driver buffer per channel (10 s at DAQ_SAMPLE_RATE)
+
+
+def create_daq_task():
+    """Create and start a continuous, sample-clocked task on all DAQ channels"""
+    task = nidaqmx.Task()
+    for ch in CHANNELS.values():
+        task.ai_channels.add_ai_voltage_chan(f"{DEVICE_NAME}/{ch}")
+    task.timing.cfg_samp_clk_timing(DAQ_SAMPLE_RATE,
+                                    sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+                                    samps_per_chan=DAQ_BUFFER_SAMPLES)
+    task.start()
+    return task
+
+
+def read_daq(task):
+    """Read one value per channel - a real task averages everything buffered since the last read"""
+    if nidaqmx is None or not isinstance(task, nidaqmx.Task):
+        return task.read()  # MockDAQ
+    block = np.asarray(task.read(number_of_samples_per_channel=nidaqmx.constants.READ_ALL_AVAILABLE),
+                       dtype=float)
+    if block.size == 0:
+        return task.read()  # Nothing buffered yet - wait for the next single sample
+    return block.reshape(len(CHANNELS), -1).mean(axis=1).tolist()
 
 # TTL Frame Fields - ترتيب البيانات في إطار TTL
 TTL_FIELDS = {
@@ -105,12 +155,29 @@ TTL_FIELDS = {
 }
 
 # Professional Color Scheme for Company Use - User Specified Colors
+_LED_NAMES = CHANNEL_NAMES[:4]  # Heat, Ready, Eco, Clean
 LED_COLORS = {
     'Heat': QColor(255, 165, 0),      # Orange
     'Ready': QColor(255, 0, 0),       # Red
     'Eco': QColor(0, 255, 0),         # Green
     'Clean': QColor(220, 220, 220)    # White Gray
 }
+_LED_BRUSHES = {name: QBrush(color) for name, color in LED_COLORS.items()}
+# State text for every combination of active LEDs, indexed by bitmask (bit k = _LED_NAMES[k])
+_STATE_TEXT = tuple(' + '.join(name for k, name in enumerate(_LED_NAMES) if bits >> k & 1) or "None"
+                    for bits in range(1 << len(_LED_NAMES)))
+# Current State text when every LED is on (All5) / off (All0)
+_EVENT_STATES = (_STATE_TEXT[-1], _STATE_TEXT[0])
+_BRUSH_CACHE = {}
+
+
+def _brush(*color):
+    """Shared QBrush per colour - table cells reuse one brush instead of building their own"""
+    brush = _BRUSH_CACHE.get(color)
+    if brush is None:
+        brush = _BRUSH_CACHE[color] = QBrush(QColor(*color))
+    return brush
+
 
 COLORS = {
     'Heat': QColor(255, 165, 0),      # Orange
@@ -127,6 +194,206 @@ ALL_FIVE_MAX = 5.0
 ALL_ZERO_MIN = 0.0
 ALL_ZERO_MAX = 0.44
 
+# Lamp status parsing (casefolded key -> display name)
+_LAMP_NAMES = {'heat': 'Heat', 'ready': 'Ready', 'eco': 'Eco', 'clean': 'Clean'}
+_LAMP_SPLIT_RE = re.compile(r'[|+]')
+
+# Data log time column ("HH:MM:SS")
+_HMS_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2})')
+
+
+def _parse_lamps(state_data):
+    """Return the active lamp names found in a lamp status string"""
+    if not state_data or state_data == "None":
+        return []
+    text = state_data if isinstance(state_data, str) else str(state_data)
+    low = text.casefold()
+    parts = _LAMP_SPLIT_RE.split(low)
+    if len(parts) > 1:
+        # "Heat + Ready" / "Heat | Ready" format
+        return [_LAMP_NAMES[part] for part in map(str.strip, parts) if part in _LAMP_NAMES]
+    # Single lamp
+    return [name for key, name in _LAMP_NAMES.items() if key in low]
+
+# Number format per data_log column - values are logged raw and only formatted for display/export
+_LOG_FORMATS = (None, ".0f", ".0f", ".0f", ".0f", ".0f", ".0f", ".0f", ".0f", ".2f", ".2f", ".2f", ".2f")
+
+
+# data_log / export column headers (19-column schema with Clean Mode Automation)
+_LOG_COLUMNS = (
+    "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
+    "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
+    "Heater State", "Heater Cmd", "Clean Mode Automation"
+)
+
+
+def _format_log_value(index, value):
+    """Format one data_log cell the way it is shown and exported"""
+    if index < len(_LOG_FORMATS) and _LOG_FORMATS[index] and isinstance(value, (int, float)):
+        return format(value, _LOG_FORMATS[index])
+    return str(value)
+
+
+def _format_log_row(row_data):
+    """Formatted copy of a data_log row"""
+    return [_format_log_value(i, value) for i, value in enumerate(row_data)]
+
+
+def _safe_float(val, default=0.0):
+    """Convert value to float safely"""
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_list_access(lst, index, default=0.0):
+    """Safely access list elements"""
+    try:
+        if isinstance(lst, (list, tuple)) and len(lst) > index:
+            return _safe_float(lst[index], default)
+        return default
+    except (IndexError, TypeError):
+        return default
+
+
+def _set_text_if_changed(label, text):
+    """setText only when the text differs - an unchanged label is not relaid out every tick"""
+    if label.text() != text:
+        label.setText(text)
+
+
+# Sample TTL frame written by save_ttl_text_file
+_TTL_SAMPLE_LINE = "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0\n"
+
+# Shared stylesheets (module level so the same string is reused on every call)
+_DIALOG_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 12px;
+    }
+    QLineEdit, QTextEdit {
+        background-color: #3c3c3c;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 5px;
+        color: white;
+        font-size: 12px;
+    }
+    QPushButton {
+        background-color: #9C27B0;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: white;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #7B1FA2;
+    }
+    QPushButton:pressed {
+        background-color: #6A1B9A;
+    }
+"""
+
+_SETTINGS_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 12px;
+    }
+    QComboBox, QSpinBox, QCheckBox {
+        background-color: #3c3c3c;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 5px;
+        color: white;
+        font-size: 12px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: white;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+"""
+
+_ALERT_ON_QSS = """
+    QPushButton {
+        background-color: #ffc107;
+        color: #212529;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #e0a800;
+    }
+"""
+
+_ALERT_OFF_QSS = """
+    QPushButton {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #5a6268;
+    }
+"""
+
+_LAMP_ON_QSS = """
+    QLabel {
+        color: #00FF00;
+        font-size: 9px;
+        font-weight: bold;
+        background-color: #1a1a1a;
+        padding: 3px 6px;
+        border-radius: 3px;
+        border: 1px solid #00FF00;
+        min-width: 50px;
+        max-width: 90px;
+        text-align: center;
+        font-family: 'Segoe UI';
+    }
+"""
+
+_LAMP_OFF_QSS = """
+    QLabel {
+        color: #666666;
+        font-size: 9px;
+        font-weight: bold;
+        background-color: #1a1a1a;
+        padding: 3px 6px;
+        border-radius: 3px;
+        border: 1px solid #666666;
+        min-width: 50px;
+        text-align: center;
+        font-family: 'Segoe UI';
+    }
+"""
+
 # Default configuration
 DEFAULT_CONFIG = {
     "thresholds": {
@@ -166,6 +433,287 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Live tables receive rows in batches of this many ticks (one model insert + repaint per batch)
+TABLE_BATCH_ROWS = 4
+TABLE_MAX_ROWS = 5000  # Oldest rows are dropped beyond this - data_log keeps more for export
+DATA_LOG_MAX_ROWS = 15000  # data_log is a bounded deque - the oldest entries fall off on append
+ERROR_LOG_MAX_ENTRIES = 100
+# Per-column display formats - table rows hold raw numbers, text is only built when a cell is painted
+_DAQ_TABLE_FORMATS = (None, "{:.2f}", "{:.2f}", "{:.2f}", "{:.2f}", None, None, None, None, None, None, "{:.1f}s")
+_TTL_TABLE_FORMATS = ("{:.0f}", "{:.0f}", "{:.1f}", "{:.1f}", "{:.0f}", "{:.0f}", "{:.0f}", "{:.0f}",
+                      "{:.2f}", "{:.2f}", "{:.2f}", "{:.2f}")
+
+# Live chart downsampling - long buffers are reduced with LTTB before plotting
+CHART_LTTB_THRESHOLD = 2000  # Buffered points above which the curves are downsampled
+CHART_LTTB_POINTS = 1000     # Vertices drawn per curve after downsampling
+
+
+def _lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets - indices of n_out points that keep the shape of the curve"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # First and last points are always kept, the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_hi = edges[b + 2] if b + 2 < len(edges) else n
+        # Third triangle vertex: average of the next bucket (the last point for the final bucket)
+        avg_x, avg_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(area.argmax())
+        out[b + 1] = prev
+    return out
+
+
+def _downsample(x, y):
+    """Reduce a chart series to CHART_LTTB_POINTS once it outgrows CHART_LTTB_THRESHOLD"""
+    if len(y) <= CHART_LTTB_THRESHOLD:
+        return x, y
+    idx = _lttb_indices(x, y, CHART_LTTB_POINTS)
+    return x[idx], y[idx]
+
+
+class RingBuffer:
+    """Fixed-capacity numpy buffer for chart data - appends overwrite the oldest sample"""
+    
+    def __init__(self, capacity, dtype=float):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._idx = 0       # Next write position
+        self._filled = 0    # Number of valid samples
+    
+    def append(self, value):
+        self._data[self._idx] = value
+        self._idx = (self._idx + 1) % self.capacity
+        if self._filled < self.capacity:
+            self._filled += 1
+    
+    def clear(self):
+        self._idx = 0
+        self._filled = 0
+    
+    def keep_last(self, count):
+        """Drop all but the newest count samples"""
+        if count < self._filled:
+            ordered = self.view()
+            self.clear()
+            for value in ordered[-count:] if count > 0 else ():
+                self.append(value)
+    
+    def view(self):
+        """Samples in chronological order (one contiguous array)"""
+        if self._filled < self.capacity:
+            return self._data[:self._filled]
+        if self._idx == 0:
+            return self._data
+        return np.concatenate((self._data[self._idx:], self._data[:self._idx]))
+    
+    def __array__(self, dtype=None, copy=None):
+        data = self.view()
+        return data if dtype is None else data.astype(dtype)
+    
+    def __len__(self):
+        return self._filled
+    
+    def __bool__(self):
+        return self._filled > 0
+    
+    def __iter__(self):
+        return iter(self.view())
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view()[index].tolist()  # Slices behave like the old list buffers
+        if index < 0:
+            index += self._filled
+        if not 0 <= index < self._filled:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[(self._idx - self._filled + index) % self.capacity]
+
+
+class LogTableModel(QAbstractTableModel):
+    """Row storage for the live tables - cells are painted from plain values, no per-cell items"""
+    
+    def __init__(self, column_count, max_rows=None, parent=None):
+        super().__init__(parent)
+        self.max_rows = max_rows  # None = unbounded
+        self._headers = [""] * column_count
+        self._formats = ()  # Optional per-column format string for numeric cells
+        self._rows = []     # Display values per row
+        self._styles = []   # (background, foreground) brush pair per cell, or None
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Formatting happens here, so only cells Qt actually paints pay for it
+            value = self._rows[row][column]
+            if value is None:
+                return ""
+            fmt = self._formats[column] if column < len(self._formats) else None
+            if fmt is not None and isinstance(value, (int, float)):
+                return fmt.format(value)
+            return str(value)
+        if role in (Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole):
+            style = self._styles[row][column]
+            if style is not None:
+                return style[0] if role == Qt.ItemDataRole.BackgroundRole else style[1]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self._headers)):
+            return self._headers[section]
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def set_headers(self, labels):
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._headers) - 1)
+    
+    def set_formats(self, formats):
+        self._formats = tuple(formats)
+    
+    def append_row(self, values, styles=None):
+        """Append one row (values and optional per-cell brush pairs)"""
+        self.append_rows([values], [styles])
+    
+    def append_rows(self, rows, styles):
+        """Append a batch of rows with a single insert notification, dropping the oldest beyond max_rows"""
+        if not rows:
+            return
+        if self.max_rows is not None:
+            rows, styles = rows[-self.max_rows:], styles[-self.max_rows:]
+            self.remove_rows(0, len(self._rows) + len(rows) - self.max_rows)
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for values, row_styles in zip(rows, styles):
+            self._rows.append(list(values))
+            self._styles.append(list(row_styles) if row_styles is not None else [None] * len(values))
+        self.endInsertRows()
+    
+    def insert_rows(self, row, count):
+        columns = len(self._headers)
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._rows[row:row] = [[None] * columns for _ in range(count)]
+        self._styles[row:row] = [[None] * columns for _ in range(count)]
+        self.endInsertRows()
+    
+    def remove_rows(self, row, count):
+        count = min(count, len(self._rows) - row)
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row:row + count]
+        del self._styles[row:row + count]
+        self.endRemoveRows()
+    
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """Qt batch removal - one rowsRemoved signal for the whole range"""
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self._rows):
+            return False
+        self.remove_rows(row, count)
+        return True
+    
+    def set_cell(self, row, column, value, style=None):
+        if not (0 <= row < len(self._rows) and 0 <= column < len(self._headers)):
+            return
+        self._rows[row][column] = value
+        self._styles[row][column] = style
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+
+class LogTableView(QTableView):
+    """QTableView over a LogTableModel that keeps the QTableWidget calls used around the app"""
+    
+    def __init__(self, rows, columns, parent=None, max_rows=TABLE_MAX_ROWS):
+        super().__init__(parent)
+        self.log_model = LogTableModel(columns, max_rows, self)
+        self.setModel(self.log_model)
+        if rows:
+            self.log_model.insert_rows(0, rows)
+    
+    def setHorizontalHeaderLabels(self, labels):
+        self.log_model.set_headers(labels)
+    
+    def set_column_formats(self, formats):
+        self.log_model.set_formats(formats)
+    
+    def rowCount(self):
+        return self.log_model.rowCount()
+    
+    def columnCount(self):
+        return self.log_model.columnCount()
+    
+    def insertRow(self, row):
+        self.log_model.insert_rows(row, 1)
+    
+    def removeRow(self, row):
+        self.log_model.remove_rows(row, 1)
+    
+    def setRowCount(self, count):
+        current = self.log_model.rowCount()
+        if count < current:
+            self.log_model.remove_rows(count, current - count)
+        elif count > current:
+            self.log_model.insert_rows(current, count - current)
+    
+    def setItem(self, row, column, item):
+        """Copy a QTableWidgetItem's text and brushes into the model"""
+        background, foreground = item.background(), item.foreground()
+        style = (background if background.style() != Qt.BrushStyle.NoBrush else None,
+                 foreground if foreground.style() != Qt.BrushStyle.NoBrush else None)
+        self.log_model.set_cell(row, column, item.text(), style)
+    
+    def setCellWidget(self, row, column, widget):
+        self.setIndexWidget(self.log_model.index(row, column), widget)
+    
+    def append_row(self, values, styles=None):
+        self.log_model.append_row(values, styles)
+    
+    def append_rows(self, rows, styles):
+        self.log_model.append_rows(rows, styles)
+
+
+# 7-segment display error patterns in priority order, with their error numbers
+_DISPLAY_ERRORS = (
+    ('/iv', 1),    # Error Number 1: Invalid display
+    ('vrl', 2),    # Error Number 2: Variable length error
+    ('err', 3),    # Error Number 3: General error
+    ('Er', 4),     # Error Number 4: Error code
+    ('E-', 5),     # Error Number 5: Error dash
+    ('-E', 6),     # Error Number 6: Dash error
+)
+_DISPLAY_ERROR_RE = re.compile('|'.join(re.escape(pattern) for pattern, _ in _DISPLAY_ERRORS))
+
+
+@lru_cache(maxsize=2048)
+def _classify_display_error(data):
+    """(error_pattern, error_number) for a TTL frame, or None - pure, so repeated frames hit the cache"""
+    # One regex scan rejects clean frames; only a hit walks the patterns for priority
+    if _DISPLAY_ERROR_RE.search(data) is None:
+        return None
+    
+    for error_pattern, error_number in _DISPLAY_ERRORS:
+        if error_pattern in data:
+            return error_pattern, error_number
+    return None
+
+
 class SerialManager:
 <<<<<<< HEAD
     """Manages Serial Port communication for TTL data - Enhanced for 24/7 operation"""
@@ -552,26 +1100,19 @@ class SerialManager:
     
     def detect_display_errors(self, data):
         """Monitor for 7-segment display /iv vrl errors with error numbering"""
-        # Error mapping with specific error numbers
-        display_errors = {
-            '/iv': 1,    # Error Number 1: Invalid display
-            'vrl': 2,    # Error Number 2: Variable length error
-            'err': 3,    # Error Number 3: General error
-            'Er': 4,     # Error Number 4: Error code
-            'E-': 5,     # Error Number 5: Error dash
-            '-E': 6      # Error Number 6: Dash error
-        }
-        
-        for error_pattern, error_number in display_errors.items():
-            if error_pattern in data:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                error_msg = f"7-Segment Display Error #{error_number}: '{error_pattern}' in data '{data}'"
-                print(f"🚨 {error_msg}")
-                
-                # Log to file with error number
-                self.log_display_error(timestamp, error_pattern, data, error_number)
-                return error_number  # Return error number instead of True
-        return 0  # No error
+        match = _classify_display_error(data)
+        if match is None:
+            return 0  # No error
+        
+        # Classification is cached; reporting and logging still happen for every frame
+        error_pattern, error_number = match
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        error_msg = f"7-Segment Display Error #{error_number}: '{error_pattern}' in data '{data}'"
+        print(f"🚨 {error_msg}")
+        
+        # Log to file with error number
+        self.log_display_error(timestamp, error_pattern, data, error_number)
+        return error_number  # Return error number instead of True
     
     def validate_ttl_frame(self, values, original_data):
         """Validate TTL frame for invalid or unexpected values with error numbering"""
@@ -939,7 +1480,7 @@ class DAQThread(QThread):
                     # Real DAQ reading with enhanced error handling
                     if self.task and hasattr(self.task, 'read'):
                         try:
-                            data = self.task.read()
+                            data = read_daq(self.task)
                             consecutive_errors = 0
                             self.last_successful_read = time.time()
                             self.connection_status.emit(True)
@@ -999,10 +1540,7 @@ class DAQThread(QThread):
             
             # Try to create new DAQ task
             if nidaqmx:
-                self.task = nidaqmx.Task()
-                for ch in CHANNELS.values():
-                    self.task.ai_channels.add_ai_voltage_chan(f"{DEVICE_NAME}/{ch}")
-                self.task.start()
+                self.task = create_daq_task()
                 print("✅ DAQ reconnection successful")
                 self.connection_status.emit(True)
             else:
@@ -1021,7 +1559,7 @@ class DAQThread(QThread):
                 pass
 =======
                 else:
-                    data = self.task.read() if hasattr(self.task, 'read') and self.task else [0.0] * 12
+                    data = read_daq(self.task) if hasattr(self.task, 'read') and self.task else [0.0] * 12
                 self.data_ready.emit(data)
             except Exception as e:
                 self.error_occurred.emit(str(e))
@@ -1032,6 +1570,16 @@ class DAQThread(QThread):
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 
 class HeaterTestSystem(QWidget):
+    # Quick TTL commands offered in the serial write dialog
+    _QUICK_COMMANDS = (
+        ("All ON", "HL1,RL1,EL1,CL1"),
+        ("All OFF", "HL0,RL0,EL0,CL0"),
+        ("Heat Only", "HL1,RL0,EL0,CL0"),
+        ("Ready Only", "HL0,RL1,EL0,CL0"),
+        ("Eco Only", "HL0,RL0,EL1,CL0"),
+        ("Clean Only", "HL0,RL0,EL0,CL1")
+    )
+    
     def __init__(self):
         super().__init__()
 <<<<<<< HEAD
@@ -1048,6 +1596,7 @@ class HeaterTestSystem(QWidget):
         
         # Load configuration
         self.config = self.load_config()
+        self._serial_enabled = self.config.get('serial', {}).get('enabled', False)
         
         # Initialize heater state machine
         self.heater_system = HeaterStateMachine()
@@ -1058,7 +1607,7 @@ class HeaterTestSystem(QWidget):
         
         # Initialize Serial Manager
         self.serial_manager = SerialManager(self.config)
-        if self.config.get('serial', {}).get('enabled', False):
+        if self._serial_enabled:
             self.serial_manager.connect()
         
         print(f"⚙️ Configuration loaded:")
@@ -1112,10 +1661,7 @@ class HeaterTestSystem(QWidget):
             print("🔌 Starting in REAL DAQ MODE - Hardware connection required!")
             try:
                 if nidaqmx:
-                    self.task = nidaqmx.Task()
-                    for ch in CHANNELS.values():
-                        self.task.ai_channels.add_ai_voltage_chan(f"{DEVICE_NAME}/{ch}")
-                    self.task.start()
+                    self.task = create_daq_task()
                 else:
                     self.task = None
             except Exception as e:
@@ -1229,12 +1775,12 @@ class HeaterTestSystem(QWidget):
         
         # Enhanced table with LED-specific DAQ columns (12 columns)
 <<<<<<< HEAD
-        self.table = QTableWidget(8, 12)  # Show 8 rows initially for DAQ + State + Automation columns
+        self.table = LogTableView(8, 12)  # Show 8 rows initially for DAQ + State + Automation columns
         self.table.setHorizontalHeaderLabels([
             # DAQ LED Section (6 columns)
             "Time", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Error #",
 =======
-        self.table = QTableWidget(0, 12)  # DAQ + State + Automation columns
+        self.table = LogTableView(0, 12)  # DAQ + State + Automation columns
         self.table.setHorizontalHeaderLabels([
             # DAQ LED Section (6 columns)
             "Time", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Heater State",
@@ -1244,12 +1790,13 @@ class HeaterTestSystem(QWidget):
             # State and Count Section (5 columns)
             "Current State", "Previous State", "All5 Count", "All0 Count", "Duration"
         ])
+        self.table.set_column_formats(_DAQ_TABLE_FORMATS)
         
         # Separate TTL table
 <<<<<<< HEAD
-        self.ttl_table = QTableWidget(8, 12)  # Show 8 rows initially for TTL columns only
+        self.ttl_table = LogTableView(8, 12)  # Show 8 rows initially for TTL columns only
 =======
-        self.ttl_table = QTableWidget(0, 12)  # TTL columns only
+        self.ttl_table = LogTableView(0, 12)  # TTL columns only
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
         self.ttl_table.setHorizontalHeaderLabels([
             # TTL Section (12 columns) 
@@ -1257,6 +1804,7 @@ class HeaterTestSystem(QWidget):
             "TTL Clean Mode", "TTL Clean Hours", "TTL Clean 3Min", "TTL ECO Mode",
             "TTL Heat LED", "TTL Ready LED", "TTL ECO LED", "TTL Clean LED"
         ])
+        self.ttl_table.set_column_formats(_TTL_TABLE_FORMATS)
         
         # Setup styling for both tables
         def setup_table_style(table, column_count):
@@ -1287,7 +1835,7 @@ class HeaterTestSystem(QWidget):
                 table.setRowHeight(row, 18)  # Balanced row height for readability
             table.setFont(QFont("Segoe UI", 7))  # Balanced font size for readability
             table.setStyleSheet("""
-                QTableWidget {
+                QTableView {
                     background-color: #0a0a0a;
                     color: #ffffff;
                     gridline-color: #444444;
@@ -1297,7 +1845,7 @@ class HeaterTestSystem(QWidget):
                     border-radius: 2px;
                     alternate-background-color: #1a1a1a;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 1px 2px;
                     border: none;
                     border-bottom: 1px solid #333333;
@@ -1316,7 +1864,7 @@ class HeaterTestSystem(QWidget):
             """)
 =======
             table.setFont(QFont("Segoe UI", 8))  # Smaller font for compact display
-            table.setStyleSheet("QTableWidget{gridline-color:#666;} QHeaderView::section{background:#1f1f1f;color:white;padding:3px;border:0;font-size:8px;} QTableWidget{color:white;} ")
+            table.setStyleSheet("QTableView{gridline-color:#666;} QHeaderView::section{background:#1f1f1f;color:white;padding:3px;border:0;font-size:8px;} QTableView{color:white;} ")
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
         
         # Apply styling to both tables
@@ -1326,7 +1874,7 @@ class HeaterTestSystem(QWidget):
 <<<<<<< HEAD
         # Apply same professional styling to TTL table
         self.ttl_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #0a0a0a;
                 color: #ffffff;
                 gridline-color: #444444;
@@ -1337,13 +1885,13 @@ class HeaterTestSystem(QWidget):
                 alternate-background-color: #1a1a1a;
                 min-height: 400px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px 4px;
                 border: none;
                 border-bottom: 1px solid #333333;
                 border-right: 1px solid #333333;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2a2a2a;
                 border: 2px solid #4CAF50;
             }
@@ -1430,7 +1978,7 @@ class HeaterTestSystem(QWidget):
 <<<<<<< HEAD
         # Professional table styling - Enhanced for clarity and laptop screens
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #0a0a0a;
                 color: #ffffff;
                 gridline-color: #444444;
@@ -1441,13 +1989,13 @@ class HeaterTestSystem(QWidget):
                 alternate-background-color: #1a1a1a;
                 min-height: 400px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px 4px;
                 border: none;
                 border-bottom: 1px solid #333333;
                 border-right: 1px solid #333333;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2a2a2a;
                 border: 2px solid #4CAF50;
             }
@@ -1485,7 +2033,7 @@ class HeaterTestSystem(QWidget):
             }
         """)
 =======
-        self.table.setStyleSheet("QTableWidget{gridline-color:#666;} QHeaderView::section{background:#1f1f1f;color:white;padding:6px;border:0;} QTableWidget{color:white;} ")
+        self.table.setStyleSheet("QTableView{gridline-color:#666;} QHeaderView::section{background:#1f1f1f;color:white;padding:6px;border:0;} QTableView{color:white;} ")
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 
         # Heater Control Panel - لوحة تحكم السخان
@@ -1869,26 +2417,19 @@ class HeaterTestSystem(QWidget):
         self.alert_button = QPushButton("🔔 Alerts ON")
         self.alert_button.clicked.connect(self.toggle_alerts)
         self.alert_button.setToolTip("تشغيل/إيقاف التنبيهات")
-        self.alert_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ffc107;
-                color: #212529;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #e0a800;
-            }
-        """)
+        self.alert_button.setStyleSheet(_ALERT_ON_QSS)
         
         # Basic Buttons
         self.save_button = QPushButton("Save")
         self.stop_button = QPushButton("Stop")
         self.reset_button = QPushButton("Reset")
-        self.save_button.clicked.connect(self.save_direct)
+        self.save_button.clicked.connect(self.save_csv)
+        self.save_menu = QMenu(self)
+        self.save_menu.addAction("Save CSV", self.save_csv)
+        self.save_menu.addAction("Save XLSX", self.save_xlsx)
+        self.save_button.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.save_button.customContextMenuRequested.connect(self.show_save_menu)
+        self.save_button.setToolTip("Save CSV (right-click for XLSX)")
         self.stop_button.clicked.connect(self.stop_acquisition)
         self.reset_button.clicked.connect(self.reset_data)
 
@@ -1901,9 +2442,13 @@ class HeaterTestSystem(QWidget):
             tight_layout=True
         ))
         self.ax = self.canvas.figure.add_subplot(111)
-        self.timestamps = []
-        self.heater1_data = []
-        self.heater2_data = []
+        self.chart_points = 250               # Samples kept for the live chart
+        self.timestamps = RingBuffer(self.chart_points, dtype=object)
+        self.heater1_data = RingBuffer(self.chart_points)
+        self.heater2_data = RingBuffer(self.chart_points)
+        self.tick = 0                         # Samples processed by update_data
+        self.sample_seq = 0                   # Bumped on every chart append - cheap change detection
+        self.disp_skip = 5                    # Redraw the chart every Nth sample
 
         # Professional matplotlib styling - static, no animations
         plt.style.use('dark_background')
@@ -1915,10 +2460,27 @@ class HeaterTestSystem(QWidget):
         plt.rcParams['axes.linewidth'] = 1.5
         plt.rcParams['grid.alpha'] = 0.6
         plt.rcParams['animation.html'] = 'none'  # Disable animations
+        plt.rcParams['path.simplify'] = True  # Agg drops sub-pixel vertices before stroking
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        plt.rcParams['agg.path.chunksize'] = 10000
         plt.ioff()  # Turn off interactive mode for professional static display
         
         # Initialize chart with better styling
         self.setup_chart_styling()
+        
+        # Live plot uses pyqtgraph when available (the matplotlib figure is kept for image export)
+        self.plot_widget = None
+        if HAS_PYQTGRAPH:
+            self.plot_widget = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+            self.plot_widget.setBackground('#1a1a1a')
+            self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+            self.plot_widget.setYRange(0, 100)
+            self.plot_widget.setLabel('left', "Temperature (°C)")
+            self.plot_widget.setTitle("Live Temperature Monitoring", color="#FFFFFF")
+            self.plot_widget.addLegend(offset=(-10, 10))
+            self.curve1 = self.plot_widget.plot(pen=pg.mkPen('#0066CC', width=2), name="Water Temp")
+            self.curve2 = self.plot_widget.plot(pen=pg.mkPen('#FF6600', width=2, style=Qt.PenStyle.DashLine),
+                                                name="Target Temp")
 
         # Header bar with lamp color indicators
         header_layout = QHBoxLayout()
@@ -2150,7 +2712,7 @@ class HeaterTestSystem(QWidget):
         # Splitter with tables and chart (better ratio for laptop)
         splitter = QSplitter(Qt.Orientation.Vertical)
         splitter.addWidget(tables_splitter)
-        splitter.addWidget(self.canvas)
+        splitter.addWidget(self.plot_widget if self.plot_widget is not None else self.canvas)
         splitter.setStretchFactor(0, 2)  # More space for tables
         splitter.setStretchFactor(1, 1)  # Less space for chart
         splitter.setSizes([350, 200])  # Laptop-friendly sizes
@@ -2227,6 +2789,16 @@ class HeaterTestSystem(QWidget):
         chart_btn_layout.addWidget(self.zoom_out_button)
         chart_btn_layout.addWidget(self.save_chart_button)
         chart_btn_layout.addWidget(self.alert_button)
+        
+        # Chart refresh divider - sampling and tables still run every tick
+        self.disp_skip_spin = QSpinBox()
+        self.disp_skip_spin.setRange(1, 20)
+        self.disp_skip_spin.setValue(self.disp_skip)
+        self.disp_skip_spin.setPrefix("Redraw every ")
+        self.disp_skip_spin.setSuffix(" samples")
+        self.disp_skip_spin.setToolTip("Chart refresh rate (higher = less CPU)")
+        self.disp_skip_spin.valueChanged.connect(self.set_disp_skip)
+        chart_btn_layout.addWidget(self.disp_skip_spin)
         chart_btn_layout.addStretch()
         
         self.main_layout.addLayout(chart_btn_layout)
@@ -2310,8 +2882,10 @@ class HeaterTestSystem(QWidget):
 
         self.last_state = "None"
         self.current_state = "None"
-        self.state_start_time = time.time()
-        self.data_log = []
+        self.state_start_time = time.monotonic()  # Monotonic - state durations must not jump with wall-clock changes
+        self.data_log = deque(maxlen=DATA_LOG_MAX_ROWS)
+        self._col_lower_cache = {}             # column index -> (first row, casefolded cells) for search
+        self._pending_rows = []                # Table rows waiting for the next batch insert
         self.all_five_count = 0
         self.all_zero_count = 0
         self.last_all5_count = 0
@@ -2329,6 +2903,7 @@ class HeaterTestSystem(QWidget):
         self.start_time = time.time()
         self.uptime_hours = 0
         self.memory_usage = 0
+        self.process = psutil.Process() if psutil is not None else None  # Reused by perform_memory_cleanup
         self.data_log_max_size = 10000  # Maximum data log entries to prevent memory issues
         self.last_memory_cleanup = time.time()
         self.memory_cleanup_interval = 3600  # Cleanup every hour
@@ -2351,11 +2926,17 @@ class HeaterTestSystem(QWidget):
         self.error_count = 0                  # Total error count
         self.last_error_time = None           # Last error timestamp
         self.system_status = "OK"             # Current system status
-        self.error_log = []                   # In-memory error log for quick access
+        self.error_log = deque(maxlen=ERROR_LOG_MAX_ENTRIES)  # In-memory error log for quick access
         self.current_error_number = 0         # Current active error number
         self.last_error_number = 0            # Last detected error number
         
         os.makedirs(LOGS_DIR, exist_ok=True)
+        
+        # Alert log stays open (line-buffered) for the lifetime of the window
+        try:
+            self._alert_log_fh = open(os.path.join(LOGS_DIR, "alerts.log"), "a", buffering=1, encoding="utf-8")
+        except Exception:
+            self._alert_log_fh = None
 
         # Holder for latest values from DAQ thread
         self.last_values = None
@@ -2365,7 +2946,7 @@ class HeaterTestSystem(QWidget):
             try:
                 self.performance_optimizer = PerformanceOptimizer(self)  # type: ignore
                 self.chart_optimizer = ChartOptimizer(self)  # type: ignore
-                self.auto_save_manager = AutoSaveManager(self)  # type: ignore
+                self.auto_save_manager = AutoSaveManager(self, LOGS_DIR)  # type: ignore
                 
                 # Connect performance signals
                 self.performance_optimizer.memory_usage_updated.connect(self.on_memory_usage_updated)
@@ -2520,23 +3101,15 @@ class HeaterTestSystem(QWidget):
         try:
             print("🔄 Performing automatic data management...")
             
-            # Limit data log size for continuous operation
-            if len(self.data_log) > 15000:  # Keep last 15,000 entries
-                removed_count = len(self.data_log) - 10000
-                self.data_log = self.data_log[-10000:]  # Keep last 10,000
-                print(f"📄 Data log trimmed: removed {removed_count} old entries")
+            # data_log is a bounded deque (DATA_LOG_MAX_ROWS) - no trimming needed here
             
             # Limit table rows
             if self.table.rowCount() > 8000:
-                for _ in range(3000):  # Remove 3000 oldest rows
-                    if self.table.rowCount() > 0:
-                        self.table.removeRow(0)
+                self.table.model().removeRows(0, 3000)  # Remove 3000 oldest rows in one call
                 print(f"📅 Main table trimmed: removed 3000 old rows")
             
             if self.ttl_table.rowCount() > 8000:
-                for _ in range(3000):  # Remove 3000 oldest rows
-                    if self.ttl_table.rowCount() > 0:
-                        self.ttl_table.removeRow(0)
+                self.ttl_table.model().removeRows(0, 3000)  # Remove 3000 oldest rows in one call
                 print(f"📅 TTL table trimmed: removed 3000 old rows")
             
             # Force garbage collection
@@ -2673,10 +3246,10 @@ class HeaterTestSystem(QWidget):
             QMessageBox.critical(self, "Error", f"Cleanup failed: {e}")
 
     def read_signals(self):
-        """Read signals from DAQ or Serial Port with enhanced TTL support and error detection"""
+        """Read signals from DAQ or Serial Port with enhanced TTL support and error detection (None when no new sample)"""
         try:
             # First try to read from Serial Port if enabled
-            if self.config.get('serial', {}).get('enabled', False) and self.serial_manager.connected:
+            if self._serial_enabled and self.serial_manager.connected:
                 serial_data = self.serial_manager.read_data()
                 if serial_data:
                     print(f"📡 TTL Data Received: {serial_data}")
@@ -2698,9 +3271,13 @@ class HeaterTestSystem(QWidget):
                     self.heater_system.update_from_ttl(parsed_data)
                     return parsed_data
             
-            # Fallback to DAQ/Simulation
+            # Fallback to DAQ/Simulation - while the DAQ thread owns the task there is no new
+            # sample until it delivers one; no blocking task.read() on the GUI thread
+            daq_thread = getattr(self, 'daq_thread', None)
+            if daq_thread is not None and daq_thread.isRunning():
+                return None
             if hasattr(self.task, 'read') and self.task:
-                return self.task.read()
+                return read_daq(self.task)
             else:
                 return [0.0] * 12
         except Exception as e:
@@ -2717,48 +3294,33 @@ class HeaterTestSystem(QWidget):
             self.last_values = None
         else:
             values = self.read_signals()
+            if values is None:
+                return  # No new sample - nothing is logged or drawn
         timestamp = datetime.now().strftime("%H:%M:%S")
         
         # Handle both old (6 values) and new (12 values) formats safely
-        def safe_float(val, default=0.0):
-            """Convert value to float safely"""
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return default
-        
-        def safe_list_access(lst, index, default=0.0):
-            """Safely access list elements"""
-            try:
-                if isinstance(lst, (list, tuple)) and len(lst) > index:
-                    return safe_float(lst[index], default)
-                return default
-            except (IndexError, TypeError):
-                return default
-        
-        # Process data safely based on format detected
         if isinstance(values, (list, tuple)) and len(values) == 6:
             # Old format: heat, ready, eco, clean, heater1, heater2
             mode, heater, water_temp, target_temp, clean_mode, clean_hours = 0, 0, 0, 0, 0, 0
             clean_3min, eco_mode = 0, 0
-            heat_led = safe_list_access(values, 0)
-            ready_led = safe_list_access(values, 1)
-            eco_led = safe_list_access(values, 2)
-            clean_led = safe_list_access(values, 3)
+            heat_led = _safe_list_access(values, 0)
+            ready_led = _safe_list_access(values, 1)
+            eco_led = _safe_list_access(values, 2)
+            clean_led = _safe_list_access(values, 3)
         elif isinstance(values, (list, tuple)) and len(values) >= 12:
             # New format: mode, heater, water_temp, target_temp, clean_mode, clean_hours, clean_3min, eco_mode, heat_led, ready_led, eco_led, clean_led
-            mode = safe_list_access(values, 0)
-            heater = safe_list_access(values, 1)
-            water_temp = safe_list_access(values, 2)
-            target_temp = safe_list_access(values, 3)
-            clean_mode = safe_list_access(values, 4)
-            clean_hours = safe_list_access(values, 5)
-            clean_3min = safe_list_access(values, 6)
-            eco_mode = safe_list_access(values, 7)
-            heat_led = safe_list_access(values, 8)
-            ready_led = safe_list_access(values, 9)
-            eco_led = safe_list_access(values, 10)
-            clean_led = safe_list_access(values, 11)
+            mode = _safe_list_access(values, 0)
+            heater = _safe_list_access(values, 1)
+            water_temp = _safe_list_access(values, 2)
+            target_temp = _safe_list_access(values, 3)
+            clean_mode = _safe_list_access(values, 4)
+            clean_hours = _safe_list_access(values, 5)
+            clean_3min = _safe_list_access(values, 6)
+            eco_mode = _safe_list_access(values, 7)
+            heat_led = _safe_list_access(values, 8)
+            ready_led = _safe_list_access(values, 9)
+            eco_led = _safe_list_access(values, 10)
+            clean_led = _safe_list_access(values, 11)
         else:
             # Default values if data is insufficient or wrong type
             mode, heater, water_temp, target_temp, clean_mode, clean_hours = 0, 0, 25, 30, 0, 0
@@ -2787,7 +3349,7 @@ class HeaterTestSystem(QWidget):
             self.heater_status_label.setText(
                 f"Heater: {heater_cmd_text} | State: {state_name} | {self.heater_system.current_temp:.1f}°C → {self.heater_system.set_temp:.0f}°C | Clean Auto: {clean_status}"
             )
-            if self.config.get('serial', {}).get('enabled', False) and self.serial_manager.connected:
+            if self._serial_enabled and self.serial_manager.connected:
                 self.serial_status_label.setText("🔌 Serial: Connected")
                 self.serial_status_label.setStyleSheet("""
                     QLabel {
@@ -2812,61 +3374,52 @@ class HeaterTestSystem(QWidget):
                     }
                 """)
 
-        active_signals = []
-        # Check LED states for active signals with safe conversion
+        # Check LED states for active signals with safe conversion (bit k = _LED_NAMES[k])
         try:
-            if float(heat_led) > 0.44:
-                active_signals.append("Heat")
-            if float(ready_led) > 0.44:
-                active_signals.append("Ready")
-            if float(eco_led) > 0.44:
-                active_signals.append("Eco")
-            if float(clean_led) > 0.44:
-                active_signals.append("Clean")
+            state_bits = ((float(heat_led) > 0.44) | (float(ready_led) > 0.44) << 1
+                          | (float(eco_led) > 0.44) << 2 | (float(clean_led) > 0.44) << 3)
         except (ValueError, TypeError):
             # Handle conversion errors gracefully
-            pass
+            state_bits = 0
 
         self.last_state = self.current_state
-        self.current_state = ' + '.join(active_signals) if active_signals else "None"
+        self.current_state = _STATE_TEXT[state_bits]
 
         if self.current_state != self.last_state:
-            self.state_start_time = time.time()
-        duration = int(time.time() - self.state_start_time)
-        self.status_label.setText(f"Current State: {self.current_state} | Previous State: {self.last_state}")
-        self.duration_label.setText(f"Duration: {duration} sec")
+            self.state_start_time = time.monotonic()
+        duration = int(time.monotonic() - self.state_start_time)
+        _set_text_if_changed(self.status_label, f"Current State: {self.current_state} | Previous State: {self.last_state}")
+        _set_text_if_changed(self.duration_label, f"Duration: {duration} sec")
 
         # تحقق من تزامن قراءات 5V و0V لجميع LED مع تحويل آمن
-        led_values = [heat_led, ready_led, eco_led, clean_led]
-        if led_values:
-            try:
-                # Convert all values to float safely
-                float_led_values = [float(v) for v in led_values]
-                
-                if all(ALL_FIVE_MIN <= v <= ALL_FIVE_MAX for v in float_led_values):
-                    self.all_five_count += 1
-                    # Update fixed counter display
-                    all5_display = self.findChild(QLabel, "all5_counter")
-                    if all5_display:
-                        all5_display.setText(f"All5 Count: {self.all_five_count}")
-                    # Alert for new All5 event
-                    if self.alerts_enabled and self.all_five_count > self.last_all5_count:
-                        self.show_alert("🎯 All5 Event!", f"All LEDs reached 4.5V-5.0V! Count: {self.all_five_count}")
-                        self.last_all5_count = self.all_five_count
-                        
-                if all(ALL_ZERO_MIN <= v <= ALL_ZERO_MAX for v in float_led_values):
-                    self.all_zero_count += 1
-                    # Update fixed counter display
-                    all0_display = self.findChild(QLabel, "all0_counter")
-                    if all0_display:
-                        all0_display.setText(f"All0 Count: {self.all_zero_count}")
-                    # Alert for new All0 event
-                    if self.alerts_enabled and self.all_zero_count > self.last_all0_count:
-                        self.show_alert("🎯 All0 Event!", f"All LEDs reached 0.0V-0.44V! Count: {self.all_zero_count}")
-                        self.last_all0_count = self.all_zero_count
-            except (ValueError, TypeError):
-                # Handle conversion errors gracefully
-                pass
+        try:
+            # One vectorized range test per sync window
+            led_values = np.array((heat_led, ready_led, eco_led, clean_led), dtype=float)
+            
+            if ((led_values >= ALL_FIVE_MIN) & (led_values <= ALL_FIVE_MAX)).all():
+                self.all_five_count += 1
+                # Update fixed counter display
+                all5_display = self.findChild(QLabel, "all5_counter")
+                if all5_display:
+                    all5_display.setText(f"All5 Count: {self.all_five_count}")
+                # Alert for new All5 event
+                if self.alerts_enabled and self.all_five_count > self.last_all5_count:
+                    self.show_alert("🎯 All5 Event!", f"All LEDs reached 4.5V-5.0V! Count: {self.all_five_count}")
+                    self.last_all5_count = self.all_five_count
+                    
+            if ((led_values >= ALL_ZERO_MIN) & (led_values <= ALL_ZERO_MAX)).all():
+                self.all_zero_count += 1
+                # Update fixed counter display
+                all0_display = self.findChild(QLabel, "all0_counter")
+                if all0_display:
+                    all0_display.setText(f"All0 Count: {self.all_zero_count}")
+                # Alert for new All0 event
+                if self.alerts_enabled and self.all_zero_count > self.last_all0_count:
+                    self.show_alert("🎯 All0 Event!", f"All LEDs reached 0.0V-0.44V! Count: {self.all_zero_count}")
+                    self.last_all0_count = self.all_zero_count
+        except (ValueError, TypeError):
+            # Handle conversion errors gracefully
+            pass
 
         # Insert data into both tables with enhanced color coding
         self.insert_data_to_tables(timestamp, values, mode, heater, water_temp, target_temp, 
@@ -2877,50 +3430,43 @@ class HeaterTestSystem(QWidget):
         clean_auto_status = self.calculate_clean_mode_automation(water_temp, target_temp)
         
         # Create data log entry with heater information + Clean Mode Automation (19 columns)
+        # Numbers are kept raw - _format_log_row formats them when saving
         log_entry = [
-            timestamp, f"{mode:.0f}", f"{heater:.0f}", f"{water_temp:.0f}", f"{target_temp:.0f}",
-            f"{clean_mode:.0f}", f"{clean_hours:.0f}", f"{clean_3min:.0f}", f"{eco_mode:.0f}",
-            f"{heat_led:.2f}", f"{ready_led:.2f}", f"{eco_led:.2f}", f"{clean_led:.2f}",
+            timestamp, mode, heater, water_temp, target_temp,
+            clean_mode, clean_hours, clean_3min, eco_mode,
+            heat_led, ready_led, eco_led, clean_led,
             self.current_state, self.last_state, str(duration),
             self.heater_system.get_state_name(),  # Heater State
             "ON" if self.heater_system.heater_cmd else "OFF",  # Heater Cmd
             clean_auto_status  # Clean Mode Automation - NEW COLUMN
         ]
         self.data_log.append(log_entry)
+        if self.auto_save_manager is not None:
+            self.auto_save_manager.append_row(log_entry)
 
-        # Update data arrays with improved memory management
+        # Update chart ring buffers (fixed size - the oldest point is overwritten)
         self.timestamps.append(datetime.now())
         self.heater1_data.append(water_temp)  # Use water temp for chart
         self.heater2_data.append(target_temp)  # Use target temp for chart
+        self.sample_seq += 1
         
-        # Keep last 250 points for smooth plotting and better performance
-        max_points = 250
-        if len(self.timestamps) > max_points:
-            self.timestamps = self.timestamps[-max_points:]
-            self.heater1_data = self.heater1_data[-max_points:]
-            self.heater2_data = self.heater2_data[-max_points:]
-        
-        # 🚀 Use highly optimized chart update if available
-        chart_updated = False
-        if self.chart_optimizer and hasattr(self.chart_optimizer, 'optimized_chart_update'):
-            try:
-                # Only update chart if optimizer determines it's necessary
-                if hasattr(self.chart_optimizer, 'has_data_changed'):
-                    if self.chart_optimizer.has_data_changed() or not hasattr(self, '_last_chart_update'):
-                        self.chart_optimizer.optimized_chart_update()
-                        self._last_chart_update = time.time()
-                        chart_updated = True
-                else:
-                    self.chart_optimizer.optimized_chart_update()
-                    chart_updated = True
-            except Exception as e:
-                print(f"Optimized chart update failed: {e}")
-                chart_updated = False
-        
-        # Fallback only if optimization failed or is not available
-        if not chart_updated:
-            # Use lightweight fallback method
-            self.lightweight_chart_update()
+        # 🚀 Update the persistent chart lines in place (no axes rebuild) every disp_skip samples
+        self.tick += 1
+        if self.tick % self.disp_skip == 0 and self.chart_visible():
+            if self.chart_optimizer is None or self.chart_optimizer.has_data_changed():
+                try:
+                    self.update_chart_lines()
+                except Exception as e:
+                    print(f"Chart update error: {e}")
+    
+    def chart_visible(self):
+        """True when the live chart can be seen - no redraws while hidden or minimized"""
+        chart = self.plot_widget if self.plot_widget is not None else self.canvas
+        return chart.isVisible() and not self.isMinimized()
+    
+    def set_disp_skip(self, value):
+        """Set how many samples pass between chart redraws"""
+        self.disp_skip = max(1, int(value))
     
     def lightweight_chart_update(self):
         """Lightweight chart update for fallback scenarios"""
@@ -2955,36 +3501,7 @@ class HeaterTestSystem(QWidget):
     def minimal_chart_redraw(self):
         """Minimal chart redraw with essential elements only"""
         try:
-            # Clear only if necessary
-            self.ax.clear()
-            
-            # Use only recent data points for performance
-            recent_size = min(100, len(self.timestamps))  # Maximum 100 points
-            if recent_size > 0:
-                recent_timestamps = self.timestamps[-recent_size:]
-                recent_heater1 = self.heater1_data[-recent_size:]
-                recent_heater2 = self.heater2_data[-recent_size:]
-                
-                # Simple line plots with minimal styling
-                self.ax.plot(recent_timestamps, recent_heater1, 'b-', linewidth=1.5, label="Water")
-                self.ax.plot(recent_timestamps, recent_heater2, 'r--', linewidth=1.5, label="Target")
-                
-                # Essential styling only
-                self.ax.set_title("Temperature Monitor", color="#FFFFFF", fontsize=9)
-                self.ax.set_facecolor('#1a1a1a')
-                self.ax.grid(True, alpha=0.3, linewidth=0.5)
-                self.ax.set_ylim(0, 100)
-                
-                # Simplified legend
-                legend = self.ax.legend(fontsize=7, loc='upper right', framealpha=0.7)
-                if legend:
-                    legend.get_frame().set_facecolor('#2a2a2a')
-                    for text in legend.get_texts():
-                        text.set_color('#FFFFFF')
-            
-            # Use efficient draw method
-            self.canvas.draw_idle()
-            
+            self.update_chart_lines()
         except Exception as e:
             print(f"Minimal chart redraw error: {e}")
     
@@ -2998,140 +3515,7 @@ class HeaterTestSystem(QWidget):
                     return
             self._last_fallback_update = current_time
             
-            # Clear and redraw with performance optimizations
-            self.ax.clear()
-            
-            # Enhanced plotting with compact styling for laptop screens
-            # Plot Water Temp with solid line and circles
-            self.ax.plot(self.timestamps, self.heater1_data, 
-                        label="Water Temp", 
-                        color="#0066CC", 
-                        linewidth=2.0,  # Thinner line
-                        alpha=0.9,
-                        marker='o',
-                        markersize=3,  # Smaller markers
-                        markeredgecolor='#FFFFFF',
-                        markeredgewidth=1,
-                        linestyle='-',
-                        zorder=3)
-            
-            # Plot Target Temp with dashed line and squares
-            self.ax.plot(self.timestamps, self.heater2_data, 
-                        label="Target Temp", 
-                        color="#FF6600", 
-                        linewidth=2.0,  # Thinner line
-                        alpha=0.9,
-                        marker='s',
-                        markersize=3,  # Smaller markers
-                        markeredgecolor='#FFFFFF',
-                        markeredgewidth=1,
-                        linestyle='--',
-                        zorder=2)
-            
-            # Add horizontal reference lines for better analysis
-            self.ax.axhline(y=25, color='#FFD700', linestyle=':', linewidth=2, alpha=0.7, label='Room Temp (25°C)')
-            self.ax.axhline(y=55, color='#FF69B4', linestyle=':', linewidth=2, alpha=0.7, label='Target Temp (55°C)')
-            
-            # Add current value annotations with compact styling
-            if self.heater1_data:
-                current_water_temp = self.heater1_data[-1]
-                self.ax.annotate(f'Water: {current_water_temp:.1f}°C', 
-                               xy=(self.timestamps[-1], current_water_temp),
-                               xytext=(5, 5), textcoords='offset points',
-                               bbox=dict(boxstyle='round,pad=0.2', facecolor='#0066CC', alpha=0.8),
-                               fontsize=8, color='white', fontweight='bold')
-            
-            if self.heater2_data:
-                current_target_temp = self.heater2_data[-1]
-                self.ax.annotate(f'Target: {current_target_temp:.1f}°C', 
-                               xy=(self.timestamps[-1], current_target_temp),
-                               xytext=(5, -15), textcoords='offset points',
-                               bbox=dict(boxstyle='round,pad=0.2', facecolor='#FF6600', alpha=0.8),
-                               fontsize=8, color='white', fontweight='bold')
-            
-            # Enhanced fill areas with better separation and transparency
-            self.ax.fill_between(self.timestamps, self.heater1_data, 
-                               color="#0066CC", alpha=0.15, 
-                               interpolate=True, zorder=1)
-            self.ax.fill_between(self.timestamps, self.heater2_data, 
-                               color="#FF6600", alpha=0.15, 
-                               interpolate=True, zorder=1)
-            
-            # Add grid for better readability
-            self.ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5, color='#666666')
-            
-            # Enhanced title and labels with compact sizing
-            self.ax.set_title("Live Temperature Monitoring", 
-                             color="#FFFFFF", fontsize=11, pad=10, 
-                             fontweight='bold', family='Segoe UI')
-            
-            self.ax.set_ylabel("Temperature (°C)", color="#FFFFFF", fontsize=10, 
-                              fontweight='bold', family='Segoe UI')
-            self.ax.set_xlabel("Time", color="#FFFFFF", fontsize=10, 
-                              fontweight='bold', family='Segoe UI')
-            
-            # Enhanced time formatting with more frequent labels
-            self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            self.ax.xaxis.set_major_locator(mdates.SecondLocator(interval=15))  # Less frequent
-            self.ax.xaxis.set_minor_locator(mdates.SecondLocator(interval=5))
-            
-            # Enhanced tick parameters with smaller fonts
-            self.ax.tick_params(axis='x', rotation=25, colors='#FFFFFF', 
-                               labelsize=8, width=1, length=4)
-            self.ax.tick_params(axis='y', colors='#FFFFFF', 
-                               labelsize=8, width=1, length=4)
-            
-            # Enhanced grid
-            self.ax.grid(True, color="#444444", linestyle='--', 
-                        linewidth=0.6, alpha=0.7)
-            self.ax.set_axisbelow(True)
-            
-            # Enhanced legend with compact styling
-            leg = self.ax.legend(facecolor="#2a2a2a", edgecolor="#555555", 
-                               framealpha=0.9, fontsize=9,  # Smaller font
-                               loc='upper right', fancybox=True, 
-                               shadow=True, borderpad=0.5)  # Less padding
-            for text in leg.get_texts():
-                text.set_color('#FFFFFF')
-                text.set_fontweight('bold')
-            
-            # Set axis limits for better visualization with fixed range
-            if len(self.heater1_data) > 1:
-                # Use fixed range suitable for temperature display
-                y_min = 0
-                y_max = 100
-                self.ax.set_ylim(y_min, y_max)
-            
-            # Enhanced layout and final touches with compact spacing
-            self.canvas.figure.tight_layout(pad=1.0)  # Less padding
-            
-            # Add subtle border to the chart
-            for spine in self.ax.spines.values():
-                spine.set_color('#555555')
-                spine.set_linewidth(1)  # Thinner border
-            
-            # Set background color for better contrast
-            self.ax.set_facecolor('#1a1a1a')
-            
-            # Add subtle text annotations for better context
-            if len(self.heater1_data) > 10:
-                # Show current values on the chart
-                current_heater1 = self.heater1_data[-1]
-                current_heater2 = self.heater2_data[-1]
-                
-                self.ax.text(0.02, 0.98, f'Heater1: {current_heater1:.2f}V', 
-                            transform=self.ax.transAxes, fontsize=9, 
-                            color='#00BFFF', fontweight='bold',
-                            bbox=dict(boxstyle='round,pad=0.3', facecolor='#1a1a1a', 
-                                    edgecolor='#00BFFF', alpha=0.8))
-                
-                self.ax.text(0.02, 0.92, f'Heater2: {current_heater2:.2f}V', 
-                            transform=self.ax.transAxes, fontsize=9, 
-                            color='#FF8C00', fontweight='bold',
-                            bbox=dict(boxstyle='round,pad=0.3', facecolor='#1a1a1a', 
-                                    edgecolor='#FF8C00', alpha=0.8))
-            
-            self.canvas.draw()
+            self.update_chart_lines()
             
             # Update performance displays
             if hasattr(self, 'update_performance_displays'):
@@ -3143,19 +3527,6 @@ class HeaterTestSystem(QWidget):
     def insert_data_to_tables(self, timestamp, values, mode, heater, water_temp, target_temp, clean_mode, clean_hours, clean_3min, eco_mode, heat_led, ready_led, eco_led, clean_led):
         """Insert data into both DAQ and TTL tables with proper color coding"""
         
-        def safe_float(val, default=0.0):
-            """Convert value to float safely"""
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return default
-        
-        # Insert row into both tables
-        daq_row = self.table.rowCount()
-        ttl_row = self.ttl_table.rowCount()
-        self.table.insertRow(daq_row)
-        self.ttl_table.insertRow(ttl_row)
-        
         # Prepare data for DAQ table (12 columns)
         # Professional PASS/FAIL evaluation based on temperature and clean duration
         pass_fail_status = self.evaluate_clean_performance(clean_mode, water_temp, target_temp)
@@ -3165,10 +3536,10 @@ class HeaterTestSystem(QWidget):
         
         daq_data = [
             timestamp,
-            f"{heat_led:.2f}",   # Heat LED column
-            f"{ready_led:.2f}",  # Ready LED column
-            f"{eco_led:.2f}",    # Eco LED column
-            f"{clean_led:.2f}",  # Clean LED column
+            heat_led,   # Heat LED column
+            ready_led,  # Ready LED column
+            eco_led,    # Eco LED column
+            clean_led,  # Clean LED column
 <<<<<<< HEAD
             str(self.current_error_number) if hasattr(self, 'current_error_number') else "0",  # Error #
 =======
@@ -3176,15 +3547,15 @@ class HeaterTestSystem(QWidget):
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
             clean_auto_status,    # Clean Mode Automation
             self.current_state, self.last_state, 
-            str(self.all_five_count), str(self.all_zero_count),
-            f"{time.time() - self.state_start_time:.1f}s"
+            self.all_five_count, self.all_zero_count,
+            time.monotonic() - self.state_start_time
         ]
         
         # Prepare data for TTL table (12 columns)
         ttl_data = [
-            f"{mode:.0f}", f"{heater:.0f}", f"{water_temp:.1f}", f"{target_temp:.1f}",
-            f"{clean_mode:.0f}", f"{clean_hours:.0f}", f"{clean_3min:.0f}", f"{eco_mode:.0f}",
-            f"{heat_led:.2f}", f"{ready_led:.2f}", f"{eco_led:.2f}", f"{clean_led:.2f}"
+            mode, heater, water_temp, target_temp,
+            clean_mode, clean_hours, clean_3min, eco_mode,
+            heat_led, ready_led, eco_led, clean_led
         ]
         
         # Get LED status for color coding (CORRECTED LOGIC)
@@ -3195,109 +3566,109 @@ class HeaterTestSystem(QWidget):
             'Clean': 0.0 <= clean_led <= 0.44     # ON when 0.0-0.44V
         }
         
-        # Insert DAQ data with LED-based color coding
+        # Build DAQ cell brushes with LED-based color coding
+        daq_styles = [None] * len(daq_data)
         for i, val in enumerate(daq_data):
-            if i in [7, 8]:  # Skip state columns for now (will use widgets)
+            if i in [7, 8]:  # State columns are filled in below
                 continue
                 
-            item = QTableWidgetItem(str(val))
+            background = foreground = None
             
             # Color coding for DAQ table
             if i == 0:  # Time column - neutral
-                item.setBackground(QBrush(QColor(60, 60, 60)))
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                background = _brush(60, 60, 60)
+                foreground = _brush(255, 255, 255)
             elif i >= 1 and i <= 4:  # LED columns (Heat, Ready, Eco, Clean)
-                led_names = ['Heat', 'Ready', 'Eco', 'Clean']
-                led_name = led_names[i-1]
+                led_name = _LED_NAMES[i-1]
                 
 <<<<<<< HEAD
                 # Force LED colors to always show - regardless of status
-                    led_color = LED_COLORS[led_name]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text on colored background
+                    background = _LED_BRUSHES[led_name]
+                    foreground = _brush(0, 0, 0)  # Black text on colored background
             elif i == 5:  # Error # column - professional red for errors, green for OK
                 error_num = int(val) if val.isdigit() else 0
                 if error_num > 0:
-                    item.setBackground(QBrush(QColor(150, 50, 50)))  # Red for errors
+                    background = _brush(150, 50, 50)  # Red for errors
                 else:
-                    item.setBackground(QBrush(QColor(50, 150, 50)))  # Green for OK
+                    background = _brush(50, 150, 50)  # Green for OK
 =======
                 if led_statuses[led_name]:  # LED is ON (0.0-0.44V)
-                    led_color = LED_COLORS[led_name]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text on colored background
+                    background = _LED_BRUSHES[led_name]
+                    foreground = _brush(0, 0, 0)  # Black text on colored background
                 else:  # LED is OFF (4.5-5.0V or other values) - normal gray
-                    item.setBackground(QBrush(QColor(60, 60, 60)))
-                    item.setForeground(QBrush(QColor(255, 255, 255)))
+                    background = _brush(60, 60, 60)
+                    foreground = _brush(255, 255, 255)
             elif i == 5:  # Heater State - professional blue
-                item.setBackground(QBrush(QColor(40, 80, 120)))
+                background = _brush(40, 80, 120)
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                foreground = _brush(255, 255, 255)
             elif i == 6:  # Clean Mode Automation - professional green as specified
                 if "ACTIVE" in str(val):
-                    item.setBackground(QBrush(QColor(50, 150, 50)))  # Green for active (#329632)
+                    background = _brush(50, 150, 50)  # Green for active (#329632)
                 elif "READY" in str(val):
-                    item.setBackground(QBrush(QColor(200, 100, 50))) # Orange for ready
+                    background = _brush(200, 100, 50) # Orange for ready
                 else:
-                    item.setBackground(QBrush(QColor(70, 70, 70)))   # Gray for standby
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                    background = _brush(70, 70, 70)   # Gray for standby
+                foreground = _brush(255, 255, 255)
             elif i == 9:  # All5 Count - professional green
-                item.setBackground(QBrush(QColor(50, 120, 50)))
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                background = _brush(50, 120, 50)
+                foreground = _brush(255, 255, 255)
             elif i == 10:  # All0 Count - professional red
-                item.setBackground(QBrush(QColor(120, 50, 50)))
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                background = _brush(120, 50, 50)
+                foreground = _brush(255, 255, 255)
             else:  # Duration column - neutral
-                item.setBackground(QBrush(QColor(60, 60, 60)))
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                background = _brush(60, 60, 60)
+                foreground = _brush(255, 255, 255)
             
-            self.table.setItem(daq_row, i, item)
+            daq_styles[i] = (background, foreground)
         
-        # Insert TTL data with corrected color coding
+        # Build TTL cell brushes with corrected color coding
+        ttl_styles = [None] * len(ttl_data)
         for i, val in enumerate(ttl_data):
-            item = QTableWidgetItem(str(val))
+            background = foreground = None
             
             # Color coding for TTL table
             if 4 <= i <= 6:  # TTL Clean-related columns (Clean Mode, Clean Hours, Clean 3Min) - GREEN
-                item.setBackground(QBrush(QColor(50, 150, 50)))  # Green background for clean columns
-                item.setForeground(QBrush(QColor(255, 255, 255)))  # White text
+                background = _brush(50, 150, 50)  # Green background for clean columns
+                foreground = _brush(255, 255, 255)  # White text
             elif 8 <= i <= 11:  # TTL LED columns (Heat, Ready, ECO, Clean)
 <<<<<<< HEAD
                 led_index = i - 8  # 0=Heat, 1=Ready, 2=ECO, 3=Clean
-                led_names = ['Heat', 'Ready', 'Eco', 'Clean']
                 
                 # Force LED colors to always show - regardless of voltage value
-                    led_color = LED_COLORS[led_names[led_index]]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text on colored background
+                    background = _LED_BRUSHES[_LED_NAMES[led_index]]
+                    foreground = _brush(0, 0, 0)  # Black text on colored background
 =======
-                voltage_value = float(val)
                 led_index = i - 8  # 0=Heat, 1=Ready, 2=ECO, 3=Clean
-                led_names = ['Heat', 'Ready', 'Eco', 'Clean']
                 
-                if 0.0 <= voltage_value <= 0.44:  # LED ON (0.0-0.44V)
-                    led_color = LED_COLORS[led_names[led_index]]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text on colored background
+                if led_statuses[_LED_NAMES[led_index]]:  # LED ON (0.0-0.44V)
+                    background = _LED_BRUSHES[_LED_NAMES[led_index]]
+                    foreground = _brush(0, 0, 0)  # Black text on colored background
                 else:  # LED OFF (4.5-5.0V or other values) - normal gray
-                    item.setBackground(QBrush(QColor(60, 60, 60)))
-                    item.setForeground(QBrush(QColor(255, 255, 255)))
+                    background = _brush(60, 60, 60)
+                    foreground = _brush(255, 255, 255)
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
             else:  # Other TTL columns - neutral blue tint
-                item.setBackground(QBrush(QColor(40, 60, 80)))  # Blue tint for TTL
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                background = _brush(40, 60, 80)  # Blue tint for TTL
+                foreground = _brush(255, 255, 255)
             
-            self.ttl_table.setItem(ttl_row, i, item)
+            ttl_styles[i] = (background, foreground)
         
-        # Insert state display widgets in DAQ table (updated positions for 12 columns)
-        current_state_widget = self.create_lamp_display(self.current_state)
-        previous_state_widget = self.create_lamp_display(self.last_state) 
-        self.table.setCellWidget(daq_row, 7, current_state_widget)  # Current State (column 7)
-        self.table.setCellWidget(daq_row, 8, previous_state_widget)  # Previous State (column 8)
+        # Current/Previous State (columns 7/8) as lamp text instead of per-row widgets
+        for i in (7, 8):
+            lamps_text = self.convert_lamp_status_to_text(daq_data[i])
+            daq_data[i] = lamps_text
+            daq_styles[i] = (_brush("#1a1a1a"),
+                             _brush("#666666" if lamps_text == "All OFF" else "#00FF00"))
+        
+        # Rows reach the tables in batches - one model insert and repaint per TABLE_BATCH_ROWS ticks
+        self._pending_rows.append((daq_data, daq_styles, ttl_data, ttl_styles))
+        if len(self._pending_rows) >= TABLE_BATCH_ROWS:
+            self.flush_table_rows()
         
         # Update count displays
-        self.all5_count_label.setText(f"All5 Count: {self.all_five_count}")
-        self.all0_count_label.setText(f"All0 Count: {self.all_zero_count}")
+        _set_text_if_changed(self.all5_count_label, f"All5 Count: {self.all_five_count}")
+        _set_text_if_changed(self.all0_count_label, f"All0 Count: {self.all_zero_count}")
         
         # 🧽 Clean Automation Logic
         if clean_mode > 0 and self.last_clean_mode == 0:
@@ -3315,9 +3686,6 @@ class HeaterTestSystem(QWidget):
         self.last_clean_mode = clean_mode
         self.last_temperature = target_temp
         
-        # Auto-scroll both tables to bottom
-        self.table.scrollToBottom()
-        self.ttl_table.scrollToBottom()
 <<<<<<< HEAD
         
         # Add test data to show LED colors immediately
@@ -3337,15 +3705,14 @@ class HeaterTestSystem(QWidget):
                 
                 # Force LED colors for columns 1-4 (Heat, Ready, Eco, Clean)
                 if 1 <= col <= 4:
-                    led_names = ['Heat', 'Ready', 'Eco', 'Clean']
-                    led_name = led_names[col-1]
+                    led_name = _LED_NAMES[col-1]
                     led_color = LED_COLORS[led_name]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))
+                    item.setBackground(_LED_BRUSHES[led_name])
+                    item.setForeground(_brush(0, 0, 0))
                     print(f"Applied {led_name} color: {led_color} to DAQ column {col}")
                 else:
-                    item.setBackground(QBrush(QColor(60, 60, 60)))
-                    item.setForeground(QBrush(QColor(255, 255, 255)))
+                    item.setBackground(_brush(60, 60, 60))
+                    item.setForeground(_brush(255, 255, 255))
                 
                 self.table.setItem(0, col, item)
             
@@ -3359,16 +3726,15 @@ class HeaterTestSystem(QWidget):
                 
                 # Force LED colors for columns 8-11 (TTL LEDs)
                 if 8 <= col <= 11:
-                    led_names = ['Heat', 'Ready', 'Eco', 'Clean']
                     led_index = col - 8
-                    led_name = led_names[led_index]
+                    led_name = _LED_NAMES[led_index]
                     led_color = LED_COLORS[led_name]
-                    item.setBackground(QBrush(led_color))
-                    item.setForeground(QBrush(QColor(0, 0, 0)))
+                    item.setBackground(_LED_BRUSHES[led_name])
+                    item.setForeground(_brush(0, 0, 0))
                     print(f"Applied {led_name} color: {led_color} to TTL column {col}")
                 else:
-                    item.setBackground(QBrush(QColor(40, 60, 80)))
-                    item.setForeground(QBrush(QColor(255, 255, 255)))
+                    item.setBackground(_brush(40, 60, 80))
+                    item.setForeground(_brush(255, 255, 255))
                 
                 self.ttl_table.setItem(0, col, item)
             
@@ -3379,6 +3745,19 @@ class HeaterTestSystem(QWidget):
 =======
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
 
+    def flush_table_rows(self):
+        """Append the queued rows to both tables in one batch"""
+        if not self._pending_rows:
+            return
+        daq_rows, daq_styles, ttl_rows, ttl_styles = zip(*self._pending_rows)
+        self._pending_rows.clear()
+        self.table.append_rows(daq_rows, daq_styles)
+        self.ttl_table.append_rows(ttl_rows, ttl_styles)
+        
+        # Auto-scroll both tables to bottom
+        self.table.scrollToBottom()
+        self.ttl_table.scrollToBottom()
+
     def setup_chart_styling(self):
         """Setup enhanced chart styling for better visualization"""
         # Set initial chart title and labels with compact sizing
@@ -3413,10 +3792,75 @@ class HeaterTestSystem(QWidget):
             spine.set_color('#555555')
             spine.set_linewidth(1)
         
+        # Persistent line artists - updated in place with set_data
+        self.ax.xaxis_date()
+        self.line1, = self.ax.plot([], [], label="Water Temp", color="#0066CC",
+                                   linewidth=2.0, alpha=0.9, linestyle='-', zorder=3,
+                                   marker='o', markersize=3, markeredgecolor='#FFFFFF', markeredgewidth=1)
+        self.line2, = self.ax.plot([], [], label="Target Temp", color="#FF6600",
+                                   linewidth=2.0, alpha=0.9, linestyle='--', zorder=2,
+                                   marker='s', markersize=3, markeredgecolor='#FFFFFF', markeredgewidth=1)
+        
+        # Reference lines, time formatting and legend are configured once
+        self.ax.axhline(y=25, color='#FFD700', linestyle=':', linewidth=2, alpha=0.7, label='Room Temp (25°C)')
+        self.ax.axhline(y=55, color='#FF69B4', linestyle=':', linewidth=2, alpha=0.7, label='Target Temp (55°C)')
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+        self.ax.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
+        self.ax.xaxis.set_minor_locator(mdates.SecondLocator(interval=5))
+        now = mdates.date2num(datetime.now())
+        self.ax.set_xlim(now, now + 60 / 86400, auto=None)  # One minute window until data arrives
+        
+        # Current-value readouts at the newest point - moved and retexted in sync_chart_lines
+        self.water_readout = self.ax.annotate('', xy=(now, 0), xytext=(5, 5), textcoords='offset points',
+                                              bbox=dict(boxstyle='round,pad=0.2', facecolor='#0066CC', alpha=0.8),
+                                              fontsize=8, color='white', fontweight='bold', visible=False)
+        self.target_readout = self.ax.annotate('', xy=(now, 0), xytext=(5, -15), textcoords='offset points',
+                                               bbox=dict(boxstyle='round,pad=0.2', facecolor='#FF6600', alpha=0.8),
+                                               fontsize=8, color='white', fontweight='bold', visible=False)
+        
+        leg = self.ax.legend(facecolor="#2a2a2a", edgecolor="#555555", 
+                             framealpha=0.9, fontsize=9,
+                             loc='upper right', borderpad=0.5)
+        for text in leg.get_texts():
+            text.set_color('#FFFFFF')
+            text.set_fontweight('bold')
+        
         # Initial canvas draw
         self.canvas.draw()
+    
+    def update_chart_lines(self):
+        """Push the chart buffers into the live plot and schedule a repaint"""
+        if self.plot_widget is not None:
+            x = np.fromiter((t.timestamp() for t in self.timestamps.view()), dtype=float, count=len(self.timestamps))
+            self.curve1.setData(*_downsample(x, self.heater1_data.view()))
+            self.curve2.setData(*_downsample(x, self.heater2_data.view()))
+            return
+        self.sync_chart_lines()
+        self.canvas.draw_idle()
+    
+    def sync_chart_lines(self):
+        """Copy the chart buffers into the matplotlib lines"""
+        timestamps = self.timestamps.view()
+        if len(timestamps) > CHART_LTTB_THRESHOLD:
+            timestamps = mdates.date2num(timestamps)  # LTTB needs a numeric x axis
+        self.line1.set_data(*_downsample(timestamps, self.heater1_data.view()))
+        self.line2.set_data(*_downsample(timestamps, self.heater2_data.view()))
+        self.ax.relim()
+        self.ax.autoscale_view(scaley=False)
+        
+        has_data = len(self.timestamps) > 0
+        if has_data:
+            newest = mdates.date2num(self.timestamps[-1])
+            water_temp, target_temp = self.heater1_data[-1], self.heater2_data[-1]
+            self.water_readout.xy = (newest, water_temp)
+            self.water_readout.set_text(f'Water: {water_temp:.1f}°C')
+            self.target_readout.xy = (newest, target_temp)
+            self.target_readout.set_text(f'Target: {target_temp:.1f}°C')
+        self.water_readout.set_visible(has_data)
+        self.target_readout.set_visible(has_data)
 
     def reset_data(self):
+        self._pending_rows.clear()
         self.table.setRowCount(0)
         self.ttl_table.setRowCount(0)  # Clear TTL table as well
         self.data_log.clear()
@@ -3427,7 +3871,7 @@ class HeaterTestSystem(QWidget):
         self.all_zero_count = 0
         self.last_state = "None"
         self.current_state = "None"
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
         
         # 🧽 Reset automation counters
         self.clean_cycles_count = 0
@@ -3451,38 +3895,37 @@ class HeaterTestSystem(QWidget):
         
         self.status_label.setText("Current State: None | Previous State: None")
         self.duration_label.setText("Duration: 0 sec")
-        # Enhanced chart reset with better styling
-        self.ax.clear()
+        # Chart reset empties the persistent lines - axes, formatters and legend stay configured
+        self.line1.set_data([], [])
+        self.line2.set_data([], [])
+        self.water_readout.set_visible(False)
+        self.target_readout.set_visible(False)
+        self.ax.set_ylim(0, 100)
+        now = mdates.date2num(datetime.now())
+        self.ax.set_xlim(now, now + 60 / 86400, auto=None)  # One minute window until data arrives
+        if self.plot_widget is not None:
+            self.curve1.setData([], [])
+            self.curve2.setData([], [])
         self.ax.set_title("Live Temperature Monitoring - Ready", 
                          color="#FFFFFF", fontsize=11, pad=10, 
                          fontweight='bold', family='Segoe UI')
-        self.ax.set_ylabel("Temperature (°C)", color="#FFFFFF", fontsize=10, 
-                          fontweight='bold', family='Segoe UI')
-        self.ax.set_xlabel("Time", color="#FFFFFF", fontsize=10, 
-                          fontweight='bold', family='Segoe UI')
-        self.ax.grid(True, color="#444444", linestyle='--', 
-                    linewidth=0.6, alpha=0.7)
-        self.ax.set_facecolor('#1a1a1a')
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        gc.collect()  # Release the cleared log rows and table cells in one go
 
     def save_direct(self):
-        """Save data to Excel file automatically with improved formatting"""
+        """Save data in the default format (CSV - fast even for hours of data)"""
+        return self.save_csv()
+    
+    def save_csv(self):
+        """Save data to a CSV file in the logs folder"""
         if not self.data_log:
             print("No data to save!")
 <<<<<<< HEAD
             # Create empty file for testing
             os.makedirs(LOGS_DIR, exist_ok=True)
-            filename = f"heater_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            filename = f"heater_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             path = os.path.join(LOGS_DIR, filename)
-            
-            # Create empty DataFrame
-            columns = [
-                "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
-                "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
-                "Heater State", "Heater Cmd", "Clean Mode Automation"
-            ]
-            df = pd.DataFrame(columns=columns)
-            df.to_excel(path, index=False, engine='openpyxl')
+            self.write_csv(path, _LOG_COLUMNS, [])
             
             print(f"Empty data file created: {path}")
             return path
@@ -3491,52 +3934,31 @@ class HeaterTestSystem(QWidget):
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
         
         try:
-            # Create enhanced data for export with readable lamp status
-            export_data = []
-            for row_data in self.data_log:
-                enhanced_row = list(row_data)  # Copy the row
-                
-                # Convert lamp status to readable text for Current/Previous State
-                # In 16-col schema: indices 13 and 14
-                if len(enhanced_row) >= 15:
-                    enhanced_row[13] = self.convert_lamp_status_to_text(enhanced_row[13])
-                    enhanced_row[14] = self.convert_lamp_status_to_text(enhanced_row[14])
-                
-                export_data.append(enhanced_row)
+            os.makedirs(LOGS_DIR, exist_ok=True)
+            filename = f"heater_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            path = os.path.join(LOGS_DIR, filename)
             
-            # 19-column schema matching data_log with Clean Mode Automation
-            columns = [
-                "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
-                "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
-                "Heater State", "Heater Cmd", "Clean Mode Automation"
-            ]
-            df = pd.DataFrame(export_data)
-            df.columns = columns
+            self.write_csv(path, _LOG_COLUMNS, self.export_rows())
+            
+            print(f"Data saved to: {path}")
+            return path
             
+        except Exception as e:
+            print(f"Failed to save: {str(e)}")
+            return None
+    
+    def save_xlsx(self):
+        """Save data to Excel file with improved formatting"""
+        if not self.data_log:
+            print("No data to save!")
+            return None
+        
+        try:
             os.makedirs(LOGS_DIR, exist_ok=True)
             filename = f"heater_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
             path = os.path.join(LOGS_DIR, filename)
             
-            # Save to Excel with better formatting
-            with pd.ExcelWriter(path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Heater Data', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Heater Data']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            self.write_xlsx(path, 'Heater Data', _LOG_COLUMNS, self.export_rows())
             
             print(f"Data saved with improved formatting to: {path}")
             return path
@@ -3544,7 +3966,58 @@ class HeaterTestSystem(QWidget):
         except Exception as e:
             print(f"Failed to save: {str(e)}")
             return None
+    
+    def show_save_menu(self, pos):
+        """Offer both save formats on right-click of the Save button"""
+        self.save_menu.exec(self.save_button.mapToGlobal(pos))
+    
+    def export_rows(self):
+        """data_log rows formatted for export, with readable lamp status"""
+        return [self.export_row(row_data) for row_data in self.data_log]
+    
+    def export_row(self, row_data):
+        """One data_log row formatted for export"""
+        enhanced_row = _format_log_row(row_data)  # Formatted copy of the row
+        
+        # Convert lamp status to readable text for Current/Previous State (indices 13,14)
+        if len(enhanced_row) >= 15:
+            enhanced_row[13] = self.convert_lamp_status_to_text(enhanced_row[13])
+            enhanced_row[14] = self.convert_lamp_status_to_text(enhanced_row[14])
+        return enhanced_row
+    
+    def write_csv(self, path, columns, rows):
+        """Write rows to a CSV file through a 1 MiB write buffer"""
+        with open(path, 'wb', buffering=1 << 20) as raw, \
+                io.TextIOWrapper(raw, newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
 
+    def write_xlsx(self, path, sheet_name, columns, rows):
+        """Stream rows to an .xlsx file (write-only workbook, bold header, fitted column widths)"""
+        # Widths have to be known before the first row is streamed
+        widths = [len(str(column)) for column in columns]
+        for row in rows:
+            for i, value in enumerate(row[:len(widths)]):
+                length = len(str(value))
+                if length > widths[i]:
+                    widths[i] = length
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        for i, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(i)].width = min(width + 2, 50)
+        
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        worksheet.append(header)
+        for row in rows:
+            worksheet.append(row)
+        workbook.save(path)
+    
     def start_acquisition(self):
         """Start or restart data acquisition"""
         try:
@@ -3569,6 +4042,7 @@ class HeaterTestSystem(QWidget):
     def stop_acquisition(self):
         """Stop data acquisition safely"""
         self.timer.stop()
+        self.flush_table_rows()
         try:
             if hasattr(self.task, 'stop'):
                 if hasattr(self.task, 'stop') and self.task is not None:
@@ -3598,26 +4072,7 @@ class HeaterTestSystem(QWidget):
         os.makedirs(LOGS_DIR, exist_ok=True)
         csv_path = os.path.join(LOGS_DIR, "heater_log.csv")
         
-        # Create enhanced data for CSV export with readable lamp status
-        export_data = []
-        for row_data in self.data_log:
-            enhanced_row = list(row_data)  # Copy the row
-            
-            # Convert lamp status to readable text for Current/Previous State (indices 13,14)
-            if len(enhanced_row) >= 15:
-                enhanced_row[13] = self.convert_lamp_status_to_text(enhanced_row[13])
-                enhanced_row[14] = self.convert_lamp_status_to_text(enhanced_row[14])
-            
-            export_data.append(enhanced_row)
-        
-        with open(csv_path, "w", newline="", encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
-                "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
-                "Heater State", "Heater Cmd", "Clean Mode Automation"
-            ])
-            writer.writerows(export_data)
+        self.write_csv(csv_path, _LOG_COLUMNS, self.export_rows())
         
         try:
             if hasattr(self.task, 'close'):
@@ -3630,6 +4085,15 @@ class HeaterTestSystem(QWidget):
         if hasattr(self, 'serial_manager'):
             self.serial_manager.disconnect()
         
+        # Flush the streamed auto-save CSV
+        if getattr(self, 'auto_save_manager', None) is not None:
+            self.auto_save_manager.close()
+        
+        # Close alert log
+        if getattr(self, '_alert_log_fh', None) is not None:
+            self._alert_log_fh.close()
+            self._alert_log_fh = None
+        
         if a0 is not None:
             a0.accept()
     
@@ -3682,10 +4146,7 @@ class HeaterTestSystem(QWidget):
                 self.task = MockDAQ()
             else:
                 try:
-                    self.task = nidaqmx.Task()
-                    for ch in CHANNELS.values():
-                        self.task.ai_channels.add_ai_voltage_chan(f"{DEVICE_NAME}/{ch}")
-                    self.task.start()
+                    self.task = create_daq_task()
                 except Exception as e:
                     QMessageBox.warning(self, "DAQ", f"فشل الاتصال بالعتاد: {e}\nسيتم التحويل إلى المحاكاة.")
                     self.simulation_mode = True
@@ -3843,10 +4304,8 @@ class HeaterTestSystem(QWidget):
                 'count': self.error_count + 1
             }
             
-            # Add to in-memory log
+            # Add to in-memory log (bounded deque keeps the last 100 errors)
             self.error_log.append(error_entry)
-            if len(self.error_log) > 100:  # Keep last 100 errors
-                self.error_log.pop(0)
             
             # Update error statistics
             self.error_count += 1
@@ -4160,7 +4619,7 @@ class HeaterTestSystem(QWidget):
                 # Create enhanced data for export
                 export_data = []
                 for row_data in self.data_log:
-                    enhanced_row = list(row_data)
+                    enhanced_row = _format_log_row(row_data)
                     
                     # Convert lamp status to readable text (indices 13,14 in 16-col schema)
                     if len(enhanced_row) >= 15:
@@ -4372,7 +4831,7 @@ class HeaterTestSystem(QWidget):
                     "Ready" if len(daq_data) > 6 and daq_data[6] > 0.5 else "None",  # Previous State
                     str(self.all_five_count),  # All5 Count
                     str(self.all_zero_count),  # All0 Count
-                    f"{time.time() - self.state_start_time:.1f}s"  # Duration
+                    f"{time.monotonic() - self.state_start_time:.1f}s"  # Duration
                 ]
                 
                 # Insert data into table
@@ -4442,7 +4901,7 @@ class HeaterTestSystem(QWidget):
                 self.clean_counter_label.setText(f"🧽 Clean Cycles: {self.clean_cycles_count}")
             
             # Update duration
-            duration = time.time() - self.state_start_time
+            duration = time.monotonic() - self.state_start_time
             self.duration_label.setText(f"Duration: {duration:.1f} sec")
             
         except Exception as e:
@@ -4524,8 +4983,9 @@ class HeaterTestSystem(QWidget):
             
             # Limit data log size
             if len(self.data_log) > self.data_log_max_size:
-                # Keep only the last 5000 entries
-                self.data_log = self.data_log[-5000:]
+                # Keep only the last 5000 entries - trimmed in place
+                for _ in range(len(self.data_log) - 5000):
+                    self.data_log.popleft()
                 print(f"📊 Data log trimmed to {len(self.data_log)} entries")
             
             # Update uptime
@@ -4536,12 +4996,9 @@ class HeaterTestSystem(QWidget):
             gc.collect()
             
             # Update memory usage
-            # pyright: reportMissingModuleSource=false
-            import psutil
-            process = psutil.Process()
-            self.memory_usage = process.memory_info().rss / 1024 / 1024  # MB
-            
-            print(f"💾 Memory usage: {self.memory_usage:.1f} MB | Uptime: {self.uptime_hours:.1f} hours")
+            if self.process is not None:
+                self.memory_usage = self.process.memory_info().rss / 1024 / 1024  # MB
+                print(f"💾 Memory usage: {self.memory_usage:.1f} MB | Uptime: {self.uptime_hours:.1f} hours")
             
             self.last_memory_cleanup = current_time
             
@@ -4567,6 +5024,7 @@ class HeaterTestSystem(QWidget):
     def stop_acquisition(self):
         """Stop data acquisition with proper cleanup"""
         try:
+            self.flush_table_rows()
             if self.daq_thread.isRunning():
                 self.daq_thread.stop()
                 self.daq_thread.wait(5000)  # Wait up to 5 seconds
@@ -4598,38 +5056,7 @@ class HeaterTestSystem(QWidget):
         dialog = QDialog(self)
         dialog.setWindowTitle("Serial Port Settings")
         dialog.setFixedSize(400, 500)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QComboBox, QSpinBox, QCheckBox {
-                background-color: #3c3c3c;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        dialog.setStyleSheet(_SETTINGS_DIALOG_QSS)
         
         layout = QVBoxLayout()
         
@@ -4765,6 +5192,7 @@ class HeaterTestSystem(QWidget):
     def save_serial_settings(self, dialog, enabled, port, baudrate, timeout, data_bits, stop_bits, parity):
         """Save serial port settings"""
         self.config['serial']['enabled'] = enabled
+        self._serial_enabled = enabled
         self.config['serial']['port'] = port
         self.config['serial']['baudrate'] = baudrate
         self.config['serial']['timeout'] = timeout
@@ -4783,15 +5211,15 @@ class HeaterTestSystem(QWidget):
     
     def write_to_serial(self, data):
         """Write data to serial port"""
-        if self.config.get('serial', {}).get('enabled', False) and self.serial_manager.connected:
-            success = self.serial_manager.write_data(data)
-            if success:
-                print(f"📤 Serial Write: {data}")
-                return True
-            else:
-                print(f"❌ Serial Write Failed: {data}")
-                return False
-        return False
+        if not (self._serial_enabled and self.serial_manager.connected):
+            return False
+        success = self.serial_manager.write_data(data)
+        if success:
+            print(f"📤 Serial Write: {data}")
+            return True
+        else:
+            print(f"❌ Serial Write Failed: {data}")
+            return False
     
     def send_ttl_command(self, command):
         """Send TTL command to serial port"""
@@ -4802,38 +5230,7 @@ class HeaterTestSystem(QWidget):
         dialog = QDialog(self)
         dialog.setWindowTitle("📤 Send TTL Command")
         dialog.setFixedSize(400, 300)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #3c3c3c;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #9C27B0;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #7B1FA2;
-            }
-            QPushButton:pressed {
-                background-color: #6A1B9A;
-            }
-        """)
+        dialog.setStyleSheet(_DIALOG_DARK_QSS)
         
         layout = QVBoxLayout()
         
@@ -4841,8 +5238,9 @@ class HeaterTestSystem(QWidget):
         status_label = QLabel("Serial Port Status:")
         layout.addWidget(status_label)
         
-        if self.config.get('serial', {}).get('enabled', False) and self.serial_manager.connected:
-            status_text = f"✅ Connected to {self.config['serial']['port']}"
+        serial_cfg = self.config.get('serial') or {}
+        if serial_cfg.get('enabled') and self.serial_manager.connected:
+            status_text = f"✅ Connected to {serial_cfg.get('port', '?')}"
             status_color = "#4CAF50"
         else:
             status_text = "❌ Not connected"
@@ -4866,16 +5264,7 @@ class HeaterTestSystem(QWidget):
         
         quick_buttons_layout = QHBoxLayout()
         
-        quick_commands = [
-            ("All ON", "HL1,RL1,EL1,CL1"),
-            ("All OFF", "HL0,RL0,EL0,CL0"),
-            ("Heat Only", "HL1,RL0,EL0,CL0"),
-            ("Ready Only", "HL0,RL1,EL0,CL0"),
-            ("Eco Only", "HL0,RL0,EL1,CL0"),
-            ("Clean Only", "HL0,RL0,EL0,CL1")
-        ]
-        
-        for name, cmd in quick_commands:
+        for name, cmd in self._QUICK_COMMANDS:
             btn = QPushButton(name)
             btn.clicked.connect(lambda checked, c=cmd: command_input.setText(c))
             quick_buttons_layout.addWidget(btn)
@@ -4951,32 +5340,38 @@ class HeaterTestSystem(QWidget):
         layout.addWidget(results_table)
         
         def perform_search():
-            search_term = search_input.text().lower()
+            search_term = search_input.text().casefold()
             selected_column = column_combo.currentText()
             
             if not search_term:
                 return
             
             results = []
-            for row_data in self.data_log:
-                if selected_column == "All":
-                    # Search in all columns
-                    row_text = " ".join(str(cell) for cell in row_data).lower()
+            if selected_column == "All":
+                # Search in all columns
+                for row_data in self.data_log:
+                    row_text = " ".join(_format_log_row(row_data)).casefold()
                     if search_term in row_text:
                         results.append(row_data)
-                else:
-                    # Search in specific column
-                    column_index = column_combo.currentIndex() - 1  # -1 for "All"
-                    if 0 <= column_index < len(row_data):
-                        if search_term in str(row_data[column_index]).lower():
-                            results.append(row_data)
-            
-            # Display results
-            results_table.setRowCount(len(results))
-            for i, row_data in enumerate(results):
-                for j, cell in enumerate(row_data):
-                    item = QTableWidgetItem(str(cell))
-                    results_table.setItem(i, j, item)
+            else:
+                # Search in specific column
+                column_index = column_combo.currentIndex() - 1  # -1 for "All"
+                if column_index >= 0:
+                    column_text = self._column_casefold(column_index)
+                    results = [row_data for row_data, text in zip(self.data_log, column_text) if search_term in text]
+            
+            # Display results (one layout pass for the whole fill)
+            results_table.setUpdatesEnabled(False)
+            results_table.setSortingEnabled(False)
+            results_table.blockSignals(True)
+            try:
+                results_table.setRowCount(len(results))
+                for i, row_data in enumerate(results):
+                    for j, cell in enumerate(row_data):
+                        results_table.setItem(i, j, QTableWidgetItem(_format_log_value(j, cell)))
+            finally:
+                results_table.blockSignals(False)
+                results_table.setUpdatesEnabled(True)
             
             dialog.setWindowTitle(f"🔍 Search Results ({len(results)} found)")
         
@@ -4986,39 +5381,46 @@ class HeaterTestSystem(QWidget):
         dialog.setLayout(layout)
         dialog.exec()
     
+    def _column_casefold(self, column_index):
+        """Casefolded text of one data log column, extended as new rows arrive"""
+        data_log = self.data_log
+        first_row = data_log[0] if data_log else None
+        cached = self._col_lower_cache.get(column_index)
+        if cached is None or cached[0] is not first_row or len(cached[1]) > len(data_log):
+            # Log was trimmed or reset - rebuild this column
+            cached = (first_row, [])
+            self._col_lower_cache[column_index] = cached
+        column_text = cached[1]
+        for row_data in itertools.islice(data_log, len(column_text), None):
+            column_text.append(_format_log_value(column_index, row_data[column_index]).casefold() if column_index < len(row_data) else "")
+        return column_text
+    
     def show_analytics(self):
         """Show analytics and statistics"""
-        if not self.data_log:
+        n = len(self.data_log)
+        if n == 0:
             QMessageBox.warning(self, "Analytics", "No data available for analysis!")
             return
         
         try:
-            # Calculate statistics
-            heat_values = [float(row[1]) for row in self.data_log]
-            ready_values = [float(row[2]) for row in self.data_log]
-            eco_values = [float(row[3]) for row in self.data_log]
-            clean_values = [float(row[4]) for row in self.data_log]
-            heater1_values = [float(row[5]) for row in self.data_log]
-            heater2_values = [float(row[6]) for row in self.data_log]
-            
-            # Calculate statistics for each channel
+            # Calculate statistics for each channel (columns 1-6) in one pass per statistic
+            values = np.array([row[1:7] for row in self.data_log], dtype=float)
+            mins, maxs, avgs = values.min(axis=0), values.max(axis=0), values.mean(axis=0)
             stats = {}
-            for name, values in [("Heat", heat_values), ("Ready", ready_values), 
-                               ("Eco", eco_values), ("Clean", clean_values),
-                               ("Heater1", heater1_values), ("Heater2", heater2_values)]:
+            for i, name in enumerate(("Heat", "Ready", "Eco", "Clean", "Heater1", "Heater2")):
                 stats[name] = {
-                    "Min": min(values),
-                    "Max": max(values),
-                    "Avg": sum(values) / len(values),
-                    "Count": len(values)
+                    "Min": mins[i],
+                    "Max": maxs[i],
+                    "Avg": avgs[i],
+                    "Count": n
                 }
             
             # Create analytics report
             report = "📊 ANALYTICS REPORT\n"
             report += "=" * 50 + "\n\n"
             
-            report += f"📈 Total Records: {len(self.data_log)}\n"
-            report += f"⏱️ Session Duration: {len(self.data_log) * 0.5:.1f} seconds\n\n"
+            report += f"📈 Total Records: {n}\n"
+            report += f"⏱️ Session Duration: {n * 0.5:.1f} seconds\n\n"
             
             report += "🔢 CHANNEL STATISTICS:\n"
             report += "-" * 30 + "\n"
@@ -5036,11 +5438,10 @@ class HeaterTestSystem(QWidget):
             report += f"All0 Events: {self.all_zero_count}\n"
             
             # Calculate event frequencies
-            if len(self.data_log) > 0:
-                all5_freq = self.all_five_count / len(self.data_log) * 100
-                all0_freq = self.all_zero_count / len(self.data_log) * 100
-                report += f"All5 Frequency: {all5_freq:.2f}%\n"
-                report += f"All0 Frequency: {all0_freq:.2f}%\n"
+            all5_freq = self.all_five_count / n * 100
+            all0_freq = self.all_zero_count / n * 100
+            report += f"All5 Frequency: {all5_freq:.2f}%\n"
+            report += f"All0 Frequency: {all0_freq:.2f}%\n"
             
             QMessageBox.information(self, "📊 Analytics Report", report)
             
@@ -5067,30 +5468,7 @@ class HeaterTestSystem(QWidget):
         layout.setSpacing(2)
         
         # Parse state data to determine which lamps are on
-        active_lamps = []
-        if state_data and state_data != "None":
-            # Check which signals are active - handle both formats
-            lamp_names = ['Heat', 'Ready', 'Eco', 'Clean']
-            
-            # Handle "Heat + Ready" format
-            if '+' in str(state_data):
-                parts = str(state_data).split('+')
-                for part in parts:
-                    part = part.strip()
-                    if part in lamp_names:
-                        active_lamps.append(part)
-            # Handle "Heat | Ready" format
-            elif '|' in str(state_data):
-                parts = str(state_data).split('|')
-                for part in parts:
-                    part = part.strip()
-                    if part in lamp_names:
-                        active_lamps.append(part)
-            # Handle single lamp
-            else:
-                for lamp_name in lamp_names:
-                    if lamp_name.lower() in str(state_data).lower():
-                        active_lamps.append(lamp_name)
+        active_lamps = _parse_lamps(state_data)
         
         # Create much better text display
         if active_lamps:
@@ -5103,40 +5481,13 @@ class HeaterTestSystem(QWidget):
                 status_text = f"{len(active_lamps)} Lamps"
             
             status_label = QLabel(status_text)
-            status_label.setStyleSheet("""
-                QLabel {
-                    color: #00FF00;
-                    font-size: 9px;
-                    font-weight: bold;
-                    background-color: #1a1a1a;
-                    padding: 3px 6px;
-                    border-radius: 3px;
-                    border: 1px solid #00FF00;
-                    min-width: 50px;
-                    max-width: 90px;
-                    text-align: center;
-                    font-family: 'Segoe UI';
-                }
-            """)
+            status_label.setStyleSheet(_LAMP_ON_QSS)
             status_label.setToolTip(f"Active Lamps: {' | '.join(active_lamps)}")
             layout.addWidget(status_label)
         else:
             # Show all off status
             status_label = QLabel("OFF")
-            status_label.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 9px;
-                    font-weight: bold;
-                    background-color: #1a1a1a;
-                    padding: 3px 6px;
-                    border-radius: 3px;
-                    border: 1px solid #666666;
-                    min-width: 50px;
-                    text-align: center;
-                    font-family: 'Segoe UI';
-                }
-            """)
+            status_label.setStyleSheet(_LAMP_OFF_QSS)
             status_label.setToolTip("All lamps are OFF")
             layout.addWidget(status_label)
         
@@ -5147,32 +5498,7 @@ class HeaterTestSystem(QWidget):
     
     def convert_lamp_status_to_text(self, state_data):
         """Convert lamp status to readable text for Excel export"""
-        if not state_data or state_data == "None":
-            return "All OFF"
-        
-        # Check which signals are active - handle both formats
-        lamp_names = ['Heat', 'Ready', 'Eco', 'Clean']
-        active_lamps = []
-        
-        # Handle "Heat + Ready" format
-        if '+' in str(state_data):
-            parts = str(state_data).split('+')
-            for part in parts:
-                part = part.strip()
-                if part in lamp_names:
-                    active_lamps.append(part)
-        # Handle "Heat | Ready" format
-        elif '|' in str(state_data):
-            parts = str(state_data).split('|')
-            for part in parts:
-                part = part.strip()
-                if part in lamp_names:
-                    active_lamps.append(part)
-        # Handle single lamp
-        else:
-            for lamp_name in lamp_names:
-                if lamp_name.lower() in str(state_data).lower():
-                    active_lamps.append(lamp_name)
+        active_lamps = _parse_lamps(state_data)
         
         if active_lamps:
             if len(active_lamps) == 1:
@@ -5189,22 +5515,24 @@ class HeaterTestSystem(QWidget):
         if len(self.data_log) < 2:
             return "لا توجد بيانات كافية للتنبؤ"
         
-        intervals = []
-        last_event_time = None
-        
-        for row in self.data_log:
-            if int(row[10]) > 0 or int(row[11]) > 0:  # All5 or All0 count increased
-                if last_event_time:
-                    try:
-                        current_time = datetime.strptime(row[0], '%H:%M:%S')
-                        interval = (current_time - last_event_time).total_seconds()
-                        intervals.append(interval)
-                    except:
-                        pass
-                last_event_time = datetime.strptime(row[0], '%H:%M:%S')
-        
-        if intervals:
-            avg_interval = sum(intervals) / len(intervals)
+        # Event rows are the ones where Current State changed into the All5 or All0 state
+        try:
+            states = np.array([row[13] for row in self.data_log], dtype=object)
+        except IndexError:
+            return "لا توجد بيانات كافية للتنبؤ"
+        entered = (states[1:] != states[:-1]) & np.isin(states[1:], _EVENT_STATES)
+        event_rows = np.flatnonzero(entered) + 1
+        
+        event_seconds = []
+        for i in event_rows:
+            match = _HMS_RE.fullmatch(str(self.data_log[i][0]))
+            if match:
+                h, m, sec = match.groups()
+                event_seconds.append(int(h) * 3600 + int(m) * 60 + int(sec))
+        intervals = np.diff(event_seconds)
+        
+        if len(intervals):
+            avg_interval = float(intervals.mean())
             next_event = datetime.now().timestamp() + avg_interval
             next_event_time = datetime.fromtimestamp(next_event)
             return f"التوقع: All5/All0 القادم في {next_event_time.strftime('%H:%M:%S')}"
@@ -5226,8 +5554,8 @@ class HeaterTestSystem(QWidget):
         alert_log = f"[{alert_time}] {title}: {message}\n"
         
         try:
-            with open(os.path.join(LOGS_DIR, "alerts.log"), "a", encoding="utf-8") as f:
-                f.write(alert_log)
+            if self._alert_log_fh is not None:
+                self._alert_log_fh.write(alert_log)
         except Exception:
             pass  # Silent fail for professional operation
     
@@ -5236,39 +5564,16 @@ class HeaterTestSystem(QWidget):
         self.alerts_enabled = not self.alerts_enabled
         if self.alerts_enabled:
             self.alert_button.setText("🔔 Alerts ON")
-            self.alert_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffc107;
-                    color: #212529;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #e0a800;
-                }
-            """)
+            self.alert_button.setStyleSheet(_ALERT_ON_QSS)
         else:
             self.alert_button.setText("🔕 Alerts OFF")
-            self.alert_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """)
+            self.alert_button.setStyleSheet(_ALERT_OFF_QSS)
     
     def zoom_in_chart(self):
         """Zoom in the chart"""
+        if self.plot_widget is not None:
+            self.plot_widget.getViewBox().scaleBy((0.8, 0.8))
+            return
         current_xlim = self.ax.get_xlim()
         current_ylim = self.ax.get_ylim()
         
@@ -5281,10 +5586,13 @@ class HeaterTestSystem(QWidget):
         
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def zoom_out_chart(self):
         """Zoom out the chart"""
+        if self.plot_widget is not None:
+            self.plot_widget.getViewBox().scaleBy((1.25, 1.25))
+            return
         current_xlim = self.ax.get_xlim()
         current_ylim = self.ax.get_ylim()
         
@@ -5297,7 +5605,7 @@ class HeaterTestSystem(QWidget):
         
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
 <<<<<<< HEAD
     def save_ttl_text_file(self):
@@ -5321,32 +5629,7 @@ class HeaterTestSystem(QWidget):
                 
                 # Generate sample TTL data in the exact format shown
                 # This simulates the TTL data stream you showed in the image
-                sample_data = [
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0",
-                    "M4,H1,T26,TT73,CM0,CH3,C3M0,ECO0,HL1,RL0,EL0,CL0"
-                ]
-                
-                # Write the TTL data in the exact format
-                for line in sample_data:
-                    f.write(line + "\n")
+                f.write(_TTL_SAMPLE_LINE * 20)
                 
                 f.write("\n" + "=" * 50 + "\n")
                 f.write("END OF TTL DATA EXPORT\n")
@@ -5436,9 +5719,8 @@ class HeaterTestSystem(QWidget):
                     f.write("-" * 120 + "\n")
                     
                     # Write data
-                    for row in self.data_log:
-                        f.write(" | ".join(str(item) for item in row) + "\n")
-                    
+                    f.writelines(f"{' | '.join(_format_log_row(row))}\n" for row in self.data_log)
+
                     f.write("\n" + "=" * 80 + "\n")
                     f.write("END OF DATA EXPORT\n")
                     f.write("=" * 80 + "\n")
@@ -5466,6 +5748,7 @@ class HeaterTestSystem(QWidget):
                     filename += '.png'
                 
                 # Save the chart
+                self.sync_chart_lines()
                 self.canvas.figure.savefig(filename, dpi=300, bbox_inches='tight', 
                                          facecolor='#1a1a1a', edgecolor='none')
                 
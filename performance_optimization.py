@@ -3,14 +3,77 @@ Performance Optimization Module for Heater Monitor System
 Addresses memory leaks, stability issues, and continuous operation requirements
 """
 
+import atexit
+import csv
 import gc
+import logging
+import logging.handlers
+import os
+import platform
 import psutil
+import numpy as np
+import queue
+import struct
+import sys
 import threading
 import time
+import zlib
+from collections import deque
 from datetime import datetime, timedelta
-from PyQt6.QtCore import QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import QTimer, QThreadPool, pyqtSignal, QObject
 from PyQt6.QtWidgets import QMessageBox
 
+# Prime psutil's CPU sampler so later cpu_percent(interval=None) calls don't block
+psutil.cpu_percent(interval=None)
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket - passes at most `rate` records per second (bursts up to `rate`)"""
+    
+    def __init__(self, rate=10.0):
+        super().__init__()
+        self.rate = rate
+        self.tokens = rate
+        self.last = time.monotonic()
+    
+    def filter(self, record):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+# Cleanup/monitor chatter is queued and written to stdout by a listener thread,
+# so the GUI thread never waits on terminal I/O
+logger = logging.getLogger("performance")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.addFilter(RateLimitFilter())
+logger.addHandler(_log_queue_handler)
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drain queued messages on exit
+
+
+def trim_oldest(items, keep):
+    """Drop the oldest entries of a deque or list in place, keeping the last `keep`"""
+    excess = len(items) - keep
+    if excess <= 0:
+        return 0
+    if isinstance(items, deque):
+        for _ in range(excess):
+            items.popleft()
+    else:
+        del items[:excess]
+    return excess
+
 class PerformanceOptimizer(QObject):
     """Performance optimization and memory management system"""
     
@@ -29,14 +92,26 @@ class PerformanceOptimizer(QObject):
         self.MAX_DATA_LOG_SIZE = 10000  # Maximum data log entries
         self.MAX_TABLE_ROWS = 5000  # Maximum table rows
         self.MAX_ERROR_LOG_SIZE = 500  # Maximum error log entries
-        self.CLEANUP_INTERVAL = 300  # Cleanup every 5 minutes
+        self.CLEANUP_INTERVAL = 300  # Cleanup every 5 minutes (relaxed interval)
+        self.MIN_CLEANUP_INTERVAL = 30  # Fastest cleanup cadence under memory growth
+        self.GROWTH_WINDOW = 4  # Memory samples used for the growth-rate estimate
+        self.MEMORY_PEAK_SAMPLES = 100  # Memory readings kept for the report
+        self.MEMORY_SAMPLE_INTERVAL = 2.0  # Reuse the last RSS reading within this many seconds
+        self.GC_THRESHOLDS = (10000, 50, 10)  # Fewer young-generation passes for the per-sample churn
         
         # Performance monitoring
         self.last_cleanup = time.time()
+        self._last_mem_sample = (float('-inf'), 0.0)  # (monotonic time, MB)
+        
+        # Memory history ring - last MEMORY_PEAK_SAMPLES readings as plain arrays
+        self._peak_mb = np.zeros(self.MEMORY_PEAK_SAMPLES, dtype=np.float32)
+        self._peak_ts = np.zeros(self.MEMORY_PEAK_SAMPLES, dtype=np.int64)  # epoch ms
+        self._peak_idx = 0
+        self._peak_count = 0
+        
         self.performance_stats = {
             'startup_time': time.time(),
             'total_cleanups': 0,
-            'memory_peaks': [],
             'data_points_processed': 0
         }
         
@@ -50,31 +125,47 @@ class PerformanceOptimizer(QObject):
         self.cleanup_timer.timeout.connect(self.perform_periodic_cleanup)
         self.cleanup_timer.start(self.CLEANUP_INTERVAL * 1000)  # Convert to ms
         
-        print("🚀 Performance Optimizer initialized")
+        # What the app provides is fixed once it is wired up - probe it once, not every tick
+        self._has_data_log = hasattr(self.app, 'data_log')
+        self._has_table = hasattr(self.app, 'table')
+        self._has_ttl_table = hasattr(self.app, 'ttl_table')
+        self._has_error_log = hasattr(self.app, 'error_log')
+        self._has_timestamps = hasattr(self.app, 'timestamps')
+        
+        # Startup objects live for the whole session - move them out of the collector's reach
+        gc.set_threshold(*self.GC_THRESHOLDS)
+        gc.freeze()
+        
+        logger.info("🚀 Performance Optimizer initialized")
     
-    def get_memory_usage(self):
-        """Get current memory usage in MB"""
+    def get_memory_usage(self, max_age=None):
+        """Get current memory usage in MB - a reading up to max_age seconds old is reused (0 forces a fresh one)"""
+        if max_age is None:
+            max_age = self.MEMORY_SAMPLE_INTERVAL
         try:
-            memory_info = self.process.memory_info()
-            return memory_info.rss / 1024 / 1024  # Convert to MB
+            now = time.monotonic()
+            sampled_at, memory_mb = self._last_mem_sample
+            if now - sampled_at < max_age:
+                return memory_mb
+            memory_mb = self.process.memory_info().rss / 1024 / 1024  # Convert to MB
+            self._last_mem_sample = (now, memory_mb)
+            return memory_mb
         except Exception:
             return 0.0
     
     def monitor_performance(self):
         """Monitor system performance and trigger alerts if needed"""
         try:
-            memory_mb = self.get_memory_usage()
+            memory_mb = self.get_memory_usage(max_age=0)  # Timer-driven - always a fresh reading
             self.memory_usage_updated.emit(memory_mb)
             
-            # Track memory peaks
-            self.performance_stats['memory_peaks'].append({
-                'timestamp': datetime.now(),
-                'memory_mb': memory_mb
-            })
+            # Track memory peaks (ring buffer - the oldest reading is overwritten)
+            self._peak_mb[self._peak_idx] = memory_mb
+            self._peak_ts[self._peak_idx] = int(time.time() * 1000)
+            self._peak_idx = (self._peak_idx + 1) % self.MEMORY_PEAK_SAMPLES
+            self._peak_count = min(self._peak_count + 1, self.MEMORY_PEAK_SAMPLES)
             
-            # Keep only last 100 memory readings
-            if len(self.performance_stats['memory_peaks']) > 100:
-                self.performance_stats['memory_peaks'] = self.performance_stats['memory_peaks'][-100:]
+            self.adapt_cleanup_interval(memory_mb)
             
             # Check for memory threshold
             if memory_mb > self.MAX_MEMORY_MB:
@@ -82,17 +173,40 @@ class PerformanceOptimizer(QObject):
                 self.force_cleanup()
             
             # Check data log size
-            if hasattr(self.app, 'data_log') and len(self.app.data_log) > self.MAX_DATA_LOG_SIZE:
+            if self._has_data_log and len(self.app.data_log) > self.MAX_DATA_LOG_SIZE:
                 self.performance_alert.emit(f"Large data log: {len(self.app.data_log)} entries")
                 self.cleanup_data_log()
             
             # Check table sizes
-            if hasattr(self.app, 'table') and self.app.table.rowCount() > self.MAX_TABLE_ROWS:
+            if self._has_table and self.app.table.rowCount() > self.MAX_TABLE_ROWS:
                 self.performance_alert.emit(f"Large table: {self.app.table.rowCount()} rows")
                 self.cleanup_tables()
                 
         except Exception as e:
-            print(f"Performance monitoring error: {e}")
+            logger.error(f"Performance monitoring error: {e}")
+    
+    def adapt_cleanup_interval(self, memory_mb):
+        """Tighten the cleanup timer while memory heads for the limit, relax it when flat"""
+        window = min(self.GROWTH_WINDOW, self._peak_count)
+        target = self.CLEANUP_INTERVAL
+        if window >= 2:
+            newest = (self._peak_idx - 1) % self.MEMORY_PEAK_SAMPLES
+            oldest = (self._peak_idx - window) % self.MEMORY_PEAK_SAMPLES
+            elapsed = (self._peak_ts[newest] - self._peak_ts[oldest]) / 1000
+            growth = float(self._peak_mb[newest] - self._peak_mb[oldest]) / elapsed if elapsed > 0 else 0.0
+            if growth > 0:
+                # Aim for at least two cleanups before the limit would be reached
+                seconds_to_limit = max(0.0, self.MAX_MEMORY_MB - memory_mb) / growth
+                target = min(self.CLEANUP_INTERVAL, max(self.MIN_CLEANUP_INTERVAL, seconds_to_limit / 2))
+        
+        # Move at most 10% per sample so the interval doesn't oscillate
+        current = self.cleanup_timer.interval() / 1000
+        new_interval = min(max(target, current * 0.9), current * 1.1)
+        new_interval = min(max(new_interval, self.MIN_CLEANUP_INTERVAL), self.CLEANUP_INTERVAL)
+        if abs(new_interval - current) >= 1:
+            self.cleanup_timer.setInterval(int(new_interval * 1000))  # Restarts the countdown
+            if time.time() - self.last_cleanup >= new_interval:
+                self.perform_periodic_cleanup()  # Overdue under the new interval
     
     def perform_periodic_cleanup(self):
         """Perform periodic cleanup to maintain performance"""
@@ -100,133 +214,150 @@ class PerformanceOptimizer(QObject):
             cleanup_actions = []
             
             # Clean data log
-            if hasattr(self.app, 'data_log') and len(self.app.data_log) > self.MAX_DATA_LOG_SIZE // 2:
+            if self._has_data_log and len(self.app.data_log) > self.MAX_DATA_LOG_SIZE // 2:
                 self.cleanup_data_log()
                 cleanup_actions.append("data_log")
             
             # Clean tables
-            if hasattr(self.app, 'table') and self.app.table.rowCount() > self.MAX_TABLE_ROWS // 2:
+            if self._has_table and self.app.table.rowCount() > self.MAX_TABLE_ROWS // 2:
                 self.cleanup_tables()
                 cleanup_actions.append("tables")
             
             # Clean error logs
-            if hasattr(self.app, 'error_log') and len(self.app.error_log) > self.MAX_ERROR_LOG_SIZE:
+            if self._has_error_log and len(self.app.error_log) > self.MAX_ERROR_LOG_SIZE:
                 self.cleanup_error_logs()
                 cleanup_actions.append("error_logs")
             
-            # Force garbage collection
-            gc.collect()
-            cleanup_actions.append("garbage_collection")
+            # The collection stays on the GUI thread - it holds the GIL throughout and
+            # cycle finalizers may tear down Qt wrappers
+            self.collect_garbage()
             
             if cleanup_actions:
                 self.performance_stats['total_cleanups'] += 1
                 self.cleanup_performed.emit(", ".join(cleanup_actions))
-                print(f"🧹 Periodic cleanup performed: {', '.join(cleanup_actions)}")
+                logger.info(f"🧹 Periodic cleanup performed: {', '.join(cleanup_actions)}")
             
             self.last_cleanup = time.time()
             
         except Exception as e:
-            print(f"Periodic cleanup error: {e}")
+            logger.error(f"Periodic cleanup error: {e}")
+    
+    def collect_garbage(self):
+        """Full collection once the old generation has real work pending"""
+        try:
+            if gc.get_count()[2] > gc.get_threshold()[2] // 2:
+                gc.collect(2)
+                self.cleanup_performed.emit("garbage_collection")
+        except Exception as e:
+            logger.error(f"Garbage collection error: {e}")
     
     def cleanup_data_log(self):
         """Clean up data log to prevent memory bloat"""
         try:
-            if hasattr(self.app, 'data_log') and len(self.app.data_log) > 1000:
+            if self._has_data_log and len(self.app.data_log) > 1000:
                 # Keep only last 70% of data
                 keep_size = int(len(self.app.data_log) * 0.7)
-                removed_count = len(self.app.data_log) - keep_size
-                self.app.data_log = self.app.data_log[-keep_size:]
-                print(f"🗑️ Cleaned data log: removed {removed_count} entries, kept {keep_size}")
+                removed_count = trim_oldest(self.app.data_log, keep_size)
+                logger.info(f"🗑️ Cleaned data log: removed {removed_count} entries, kept {keep_size}")
                 
         except Exception as e:
-            print(f"Data log cleanup error: {e}")
+            logger.error(f"Data log cleanup error: {e}")
     
     def cleanup_tables(self):
         """Clean up table rows to improve performance"""
         try:
             # Clean main table
-            if hasattr(self.app, 'table') and self.app.table.rowCount() > 1000:
+            if self._has_table and self.app.table.rowCount() > 1000:
                 keep_rows = 1000
                 total_rows = self.app.table.rowCount()
                 remove_rows = total_rows - keep_rows
                 
-                # Remove oldest rows (from top)
-                for i in range(remove_rows):
-                    self.app.table.removeRow(0)
+                # Remove oldest rows (from top) in one model call
+                self._bulk_remove_top_rows(self.app.table, remove_rows)
                 
-                print(f"🗑️ Cleaned main table: removed {remove_rows} rows, kept {keep_rows}")
+                logger.info(f"🗑️ Cleaned main table: removed {remove_rows} rows, kept {keep_rows}")
             
             # Clean TTL table
-            if hasattr(self.app, 'ttl_table') and self.app.ttl_table.rowCount() > 1000:
+            if self._has_ttl_table and self.app.ttl_table.rowCount() > 1000:
                 keep_rows = 1000
                 total_rows = self.app.ttl_table.rowCount()
                 remove_rows = total_rows - keep_rows
                 
-                # Remove oldest rows (from top)
-                for i in range(remove_rows):
-                    self.app.ttl_table.removeRow(0)
+                # Remove oldest rows (from top) in one model call
+                self._bulk_remove_top_rows(self.app.ttl_table, remove_rows)
                 
-                print(f"🗑️ Cleaned TTL table: removed {remove_rows} rows, kept {keep_rows}")
+                logger.info(f"🗑️ Cleaned TTL table: removed {remove_rows} rows, kept {keep_rows}")
                 
         except Exception as e:
-            print(f"Table cleanup error: {e}")
+            logger.error(f"Table cleanup error: {e}")
+    
+    def _bulk_remove_top_rows(self, table, count):
+        """Drop the oldest rows in one model call with repaints and view signals held off"""
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.model().removeRows(0, count)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
     
     def cleanup_error_logs(self):
         """Clean up error logs to prevent memory bloat"""
         try:
-            if hasattr(self.app, 'error_log') and len(self.app.error_log) > self.MAX_ERROR_LOG_SIZE:
+            if self._has_error_log and len(self.app.error_log) > self.MAX_ERROR_LOG_SIZE:
                 # Keep only last 50% of errors
                 keep_size = self.MAX_ERROR_LOG_SIZE // 2
-                removed_count = len(self.app.error_log) - keep_size
-                self.app.error_log = self.app.error_log[-keep_size:]
-                print(f"🗑️ Cleaned error log: removed {removed_count} entries, kept {keep_size}")
+                removed_count = trim_oldest(self.app.error_log, keep_size)
+                logger.info(f"🗑️ Cleaned error log: removed {removed_count} entries, kept {keep_size}")
                 
         except Exception as e:
-            print(f"Error log cleanup error: {e}")
+            logger.error(f"Error log cleanup error: {e}")
     
     def force_cleanup(self):
         """Force immediate cleanup when memory is high"""
         try:
-            print("🚨 Force cleanup triggered due to high memory usage")
+            logger.info("🚨 Force cleanup triggered due to high memory usage")
             
             # Aggressive data log cleanup
-            if hasattr(self.app, 'data_log') and len(self.app.data_log) > 500:
+            if self._has_data_log and len(self.app.data_log) > 500:
                 keep_size = 500
-                self.app.data_log = self.app.data_log[-keep_size:]
-                print(f"🗑️ Force cleaned data log: kept only {keep_size} entries")
+                trim_oldest(self.app.data_log, keep_size)
+                logger.info(f"🗑️ Force cleaned data log: kept only {keep_size} entries")
             
             # Aggressive table cleanup
-            if hasattr(self.app, 'table') and self.app.table.rowCount() > 500:
+            if self._has_table and self.app.table.rowCount() > 500:
                 # Remove older rows
                 current_rows = self.app.table.rowCount()
                 keep_rows = 500
                 remove_rows = current_rows - keep_rows
-                for i in range(remove_rows):
-                    self.app.table.removeRow(0)
-                print(f"🗑️ Force cleaned main table: removed {remove_rows} rows")
+                self._bulk_remove_top_rows(self.app.table, remove_rows)
+                logger.info(f"🗑️ Force cleaned main table: removed {remove_rows} rows")
             
-            if hasattr(self.app, 'ttl_table') and self.app.ttl_table.rowCount() > 500:
+            if self._has_ttl_table and self.app.ttl_table.rowCount() > 500:
                 # Remove older rows
                 current_rows = self.app.ttl_table.rowCount()
                 keep_rows = 500
                 remove_rows = current_rows - keep_rows
-                for i in range(remove_rows):
-                    self.app.ttl_table.removeRow(0)
-                print(f"🗑️ Force cleaned TTL table: removed {remove_rows} rows")
+                self._bulk_remove_top_rows(self.app.ttl_table, remove_rows)
+                logger.info(f"🗑️ Force cleaned TTL table: removed {remove_rows} rows")
             
             # Clear chart data if too large
-            if hasattr(self.app, 'timestamps') and len(self.app.timestamps) > 200:
+            if self._has_timestamps and len(self.app.timestamps) > 200:
                 keep_size = 200
-                self.app.timestamps = self.app.timestamps[-keep_size:]
-                self.app.heater1_data = self.app.heater1_data[-keep_size:]
-                self.app.heater2_data = self.app.heater2_data[-keep_size:]
-                print(f"🗑️ Force cleaned chart data: kept only {keep_size} points")
+                for name in ('timestamps', 'heater1_data', 'heater2_data'):
+                    data = getattr(self.app, name)
+                    if hasattr(data, 'keep_last'):
+                        data.keep_last(keep_size)  # Ring buffer - trim in place
+                    else:
+                        setattr(self.app, name, data[-keep_size:])
+                logger.info(f"🗑️ Force cleaned chart data: kept only {keep_size} points")
             
             # Force garbage collection
             gc.collect()
             
         except Exception as e:
-            print(f"Force cleanup error: {e}")
+            logger.error(f"Force cleanup error: {e}")
     
     def get_performance_report(self):
         """Generate performance report"""
@@ -237,9 +368,10 @@ class PerformanceOptimizer(QObject):
             memory_mb = self.get_memory_usage()
             
             # Calculate average memory usage
-            if self.performance_stats['memory_peaks']:
-                avg_memory = sum(p['memory_mb'] for p in self.performance_stats['memory_peaks']) / len(self.performance_stats['memory_peaks'])
-                max_memory = max(p['memory_mb'] for p in self.performance_stats['memory_peaks'])
+            if self._peak_count:
+                peaks = self._peak_mb[:self._peak_count]  # Order doesn't matter for mean/max
+                avg_memory = float(peaks.mean())
+                max_memory = float(peaks.max())
             else:
                 avg_memory = memory_mb
                 max_memory = memory_mb
@@ -255,8 +387,8 @@ class PerformanceOptimizer(QObject):
 
 🧹 Total Cleanups: {self.performance_stats['total_cleanups']}
 📊 Data Log Size: {len(getattr(self.app, 'data_log', []))} entries
-📋 Main Table Rows: {getattr(self.app.table, 'rowCount', lambda: 0)() if hasattr(self.app, 'table') else 0}
-📋 TTL Table Rows: {getattr(self.app.ttl_table, 'rowCount', lambda: 0)() if hasattr(self.app, 'ttl_table') else 0}
+📋 Main Table Rows: {getattr(self.app.table, 'rowCount', lambda: 0)() if self._has_table else 0}
+📋 TTL Table Rows: {getattr(self.app.ttl_table, 'rowCount', lambda: 0)() if self._has_ttl_table else 0}
 🔢 Chart Points: {len(getattr(self.app, 'timestamps', []))}
 
 🎯 Memory Efficiency: {((self.MAX_MEMORY_MB - memory_mb) / self.MAX_MEMORY_MB * 100):.1f}%
@@ -277,16 +409,23 @@ class PerformanceOptimizer(QObject):
 class ChartOptimizer:
     """Optimized chart rendering for better performance"""
     
+    __slots__ = ('app', 'last_redraw', 'redraw_interval', 'partial_update_count', '_last_seq', '_hash_buf',
+                 'skip_count', 'max_skips', 'chart_dirty', 'data_points_limit', 'recent_window', '_has_timestamps',
+                 '__weakref__')
+    
     def __init__(self, app):
         self.app = app
         self.last_redraw = 0
         self.redraw_interval = 2.0  # Minimum 2 seconds between full redraws
         self.partial_update_count = 0
-        self.last_data_hash = None  # Track data changes
+        self._last_seq = 0  # app.sample_seq at the last change check
+        self._hash_buf = bytearray(24)  # Packed (count, temp1, temp2) for apps without a sample counter
         self.skip_count = 0
         self.max_skips = 3  # Skip 3 updates before forcing redraw
         self.chart_dirty = False
         self.data_points_limit = 200  # Reduced from 300 for better performance
+        self.recent_window = timedelta(minutes=5)  # Newest span kept dense when downsampling
+        self._has_timestamps = hasattr(app, 'timestamps')
         
     def should_full_redraw(self):
         """Determine if full chart redraw is needed with intelligent skipping"""
@@ -316,94 +455,71 @@ class ChartOptimizer:
             return False
     
     def has_data_changed(self):
-        """Check if chart data has actually changed"""
+        """Check if chart data has actually changed since the last check"""
+        seq = getattr(self.app, 'sample_seq', None)
+        if seq is None:  # Apps without a sample counter - CRC32 of the newest sample instead
+            seq = self.latest_sample_crc()
+        changed = seq != self._last_seq
+        self._last_seq = seq
+        return changed
+    
+    def latest_sample_crc(self):
+        """CRC32 over the packed newest sample - no tuple or string built per check"""
         try:
-            if not hasattr(self.app, 'timestamps') or not self.app.timestamps:
-                return False
-            
-            # Create a simple hash of the last few data points
-            if len(self.app.timestamps) > 0:
-                last_timestamp = self.app.timestamps[-1]
-                last_temp1 = self.app.heater1_data[-1] if self.app.heater1_data else 0
-                last_temp2 = self.app.heater2_data[-1] if self.app.heater2_data else 0
-                
-                # Simple hash of recent data
-                current_hash = hash((str(last_timestamp), last_temp1, last_temp2))
-                
-                if self.last_data_hash != current_hash:
-                    self.last_data_hash = current_hash
-                    return True
-            
-            return False
+            count = len(self.app.timestamps)
+            if count == 0:
+                return 0
+            struct.pack_into('<qdd', self._hash_buf, 0, count,
+                             self.app.heater1_data[-1], self.app.heater2_data[-1])
+            return zlib.crc32(self._hash_buf)
         except Exception:
-            return True  # If error, assume data changed
+            return -1  # Unreadable buffers - treat as changed once
+    
+    def recent_point_count(self, timestamps):
+        """Samples inside recent_window (binary search on time), at most half the point budget"""
+        half = self.data_points_limit // 2
+        newest = timestamps[-1]
+        if not isinstance(newest, (datetime, np.datetime64)):
+            return half  # No real time axis - split the budget by position
+        start = np.searchsorted(timestamps, newest - self.recent_window)
+        return max(1, min(len(timestamps) - int(start), half))
     
     def get_optimized_data_points(self):
         """Get optimized data points for plotting"""
         try:
-            if not hasattr(self.app, 'timestamps') or len(self.app.timestamps) == 0:
+            if not self._has_timestamps or len(self.app.timestamps) == 0:
                 return [], [], []
             
-            timestamps = self.app.timestamps
-            heater1_data = self.app.heater1_data
-            heater2_data = self.app.heater2_data
+            # One contiguous array per series - downsampling is a single fancy-index per array
+            timestamps = np.asarray(self.app.timestamps)
+            heater1_data = np.asarray(self.app.heater1_data, dtype=float)
+            heater2_data = np.asarray(self.app.heater2_data, dtype=float)
             
             # If data is within limit, return as is
-            if len(timestamps) <= self.data_points_limit:
+            total_points = len(timestamps)
+            if total_points <= self.data_points_limit:
                 return timestamps, heater1_data, heater2_data
             
             # Intelligent downsampling - keep recent data dense, older data sparse
-            total_points = len(timestamps)
-            keep_recent = self.data_points_limit // 2  # Keep half as recent data
+            keep_recent = self.recent_point_count(timestamps)
             keep_older = self.data_points_limit - keep_recent  # Downsample the rest
             
-            # Recent data (keep all)
-            recent_timestamps = timestamps[-keep_recent:]
-            recent_heater1 = heater1_data[-keep_recent:]
-            recent_heater2 = heater2_data[-keep_recent:]
-            
-            # Older data (downsample)
-            if total_points > keep_recent:
-                older_data_size = total_points - keep_recent
-                step = max(1, older_data_size // keep_older)
-                
-                older_timestamps = timestamps[:-keep_recent:step]
-                older_heater1 = heater1_data[:-keep_recent:step]
-                older_heater2 = heater2_data[:-keep_recent:step]
-                
-                # Ensure older data doesn't exceed limit
-                if len(older_timestamps) > keep_older:
-                    older_timestamps = older_timestamps[-keep_older:]
-                    older_heater1 = older_heater1[-keep_older:]
-                    older_heater2 = older_heater2[-keep_older:]
-                
-                # Combine older and recent data
-                plot_timestamps = older_timestamps + recent_timestamps
-                plot_heater1 = older_heater1 + recent_heater1
-                plot_heater2 = older_heater2 + recent_heater2
-                
-                # Final safety check - ensure we don't exceed limit
-                if len(plot_timestamps) > self.data_points_limit:
-                    excess = len(plot_timestamps) - self.data_points_limit
-                    plot_timestamps = plot_timestamps[excess:]
-                    plot_heater1 = plot_heater1[excess:]
-                    plot_heater2 = plot_heater2[excess:]
-            else:
-                plot_timestamps = recent_timestamps
-                plot_heater1 = recent_heater1
-                plot_heater2 = recent_heater2
+            older_data_size = total_points - keep_recent
+            step = max(1, older_data_size // keep_older)
+            older_idx = np.arange(0, older_data_size, step)[-keep_older:]
+            idx = np.concatenate((older_idx, np.arange(older_data_size, total_points)))
             
-            return plot_timestamps, plot_heater1, plot_heater2
+            return timestamps[idx], heater1_data[idx], heater2_data[idx]
             
         except Exception as e:
-            print(f"Data optimization error: {e}")
+            logger.error(f"Data optimization error: {e}")
             return self.app.timestamps, self.app.heater1_data, self.app.heater2_data
     
     def optimized_chart_update(self):
         """Highly optimized chart update with aggressive performance improvements"""
         try:
             # Quick exit if no data
-            if not hasattr(self.app, 'timestamps') or len(self.app.timestamps) == 0:
+            if not self._has_timestamps or len(self.app.timestamps) == 0:
                 return
             
             # Check if we need to redraw
@@ -417,69 +533,26 @@ class ChartOptimizer:
             if len(plot_timestamps) == 0:
                 return
             
-            # Clear and redraw with optimized settings
-            self.app.ax.clear()
+            # Persistent lines built by the app - only their data changes, the axes
+            # styling, legend and date formatters stay as they were set up
+            line1 = getattr(self.app, 'line1', None)
+            line2 = getattr(self.app, 'line2', None)
+            if line1 is None or line2 is None:
+                self.basic_chart_update()
+                return
             
-            # Use faster plotting methods
-            # Plot with minimal styling for performance
-            line1 = self.app.ax.plot(plot_timestamps, plot_heater1, 
-                           label="Water Temp", color="#0066CC", 
-                           linewidth=1.5, alpha=0.9,
-                           rasterized=True)  # Rasterize for performance
-            
-            line2 = self.app.ax.plot(plot_timestamps, plot_heater2, 
-                           label="Target Temp", color="#FF6600", 
-                           linewidth=1.5, alpha=0.9, linestyle='--',
-                           rasterized=True)  # Rasterize for performance
-            
-            # Minimal essential styling only
-            self.app.ax.set_title("Live Temperature Monitoring", 
-                                color="#FFFFFF", fontsize=10, pad=5)
-            self.app.ax.set_ylabel("Temperature (°C)", color="#FFFFFF", fontsize=9)
-            self.app.ax.set_xlabel("Time", color="#FFFFFF", fontsize=9)
-            
-            # Optimized grid
-            self.app.ax.grid(True, alpha=0.3, linewidth=0.5, color='#666666')
-            self.app.ax.set_facecolor('#1a1a1a')
-            self.app.ax.set_ylim(0, 100)
-            
-            # Simplified legend
-            legend = self.app.ax.legend(fontsize=8, loc='upper right', 
-                                       framealpha=0.8, fancybox=False, shadow=False)
-            legend.get_frame().set_facecolor('#2a2a2a')
-            for text in legend.get_texts():
-                text.set_color('#FFFFFF')
-            
-            # Optimized time formatting - less frequent updates
-            if len(plot_timestamps) > 5:
-                import matplotlib.dates as mdates
-                self.app.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-                self.app.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-            
-            # Optimized tick parameters
-            self.app.ax.tick_params(axis='x', rotation=15, colors='#FFFFFF', 
-                                   labelsize=7, width=0.5, length=2)
-            self.app.ax.tick_params(axis='y', colors='#FFFFFF', 
-                                   labelsize=7, width=0.5, length=2)
-            
-            # Remove expensive elements for performance
-            # No fill_between, no annotations, no reference lines
-            
-            # Optimized layout
-            self.app.canvas.figure.tight_layout(pad=0.5)
-            
-            # Set spine styling efficiently
-            for spine in self.app.ax.spines.values():
-                spine.set_color('#555555')
-                spine.set_linewidth(0.5)
+            line1.set_data(plot_timestamps, plot_heater1)
+            line2.set_data(plot_timestamps, plot_heater2)
+            self.app.ax.relim()
+            self.app.ax.autoscale_view(scaley=False)
             
             # Use efficient draw method
             self.app.canvas.draw_idle()  # More efficient than draw()
             
-            print(f"Chart updated with {len(plot_timestamps)} points (optimized from {len(self.app.timestamps)})")
+            logger.info(f"Chart updated with {len(plot_timestamps)} points (optimized from {len(self.app.timestamps)})")
             
         except Exception as e:
-            print(f"Optimized chart update error: {e}")
+            logger.error(f"Optimized chart update error: {e}")
             # Fallback to basic update
             self.basic_chart_update()
     
@@ -504,87 +577,108 @@ class ChartOptimizer:
             self.app.canvas.draw_idle()
             
         except Exception as e:
-            print(f"Basic chart update error: {e}")
+            logger.error(f"Basic chart update error: {e}")
+
+
+AUTO_SAVE_COLUMNS = (
+    "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
+    "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
+    "Heater State", "Heater Cmd", "Clean Mode Automation"
+)
 
 
 class AutoSaveManager:
     """Automatic data saving for reliability"""
     
-    def __init__(self, app):
+    __slots__ = ('app', 'logs_dir', 'auto_save_interval', 'csv_path', '_csv_file', '_csv_writer', '_export_row',
+                 'auto_save_timer', '_sync_pool', '__weakref__')  # __weakref__ - Qt keeps weak refs to slot owners
+    
+    def __init__(self, app, logs_dir="logs"):
         self.app = app
+        self.logs_dir = logs_dir  # The app passes its LOGS_DIR
         self.auto_save_interval = 600  # Auto-save every 10 minutes
         
+        # Rows are streamed to one append-only CSV per session as they arrive
+        self.csv_path = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._export_row = getattr(app, 'export_row', None)  # Looked up once - used per sample
+        
+        # Private pool for the fsync - close() waits on it without blocking on unrelated work
+        self._sync_pool = QThreadPool()
+        self._sync_pool.setMaxThreadCount(1)
+        
         # Setup auto-save timer
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save_data)
         self.auto_save_timer.start(self.auto_save_interval * 1000)
         
-        print("💾 Auto-save manager initialized")
+        logger.info("💾 Auto-save manager initialized")
+    
+    def append_row(self, row_data):
+        """Stream one data_log row to the session CSV"""
+        try:
+            if self._csv_writer is None:
+                os.makedirs(self.logs_dir, exist_ok=True)
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                self.csv_path = os.path.join(self.logs_dir, f"auto_save_{timestamp}.csv")
+                self._csv_file = open(self.csv_path, 'a', newline='', encoding='utf-8')
+                self._csv_writer = csv.writer(self._csv_file)
+                self._csv_writer.writerow(AUTO_SAVE_COLUMNS)
+            
+            if self._export_row is not None:
+                row_data = self._export_row(row_data)  # Formatted, readable lamp status
+            self._csv_writer.writerow(row_data)
+        except Exception as e:
+            logger.error(f"Auto-save append error: {e}")
     
     def auto_save_data(self):
         """Automatically save data to prevent loss"""
         try:
-            if hasattr(self.app, 'data_log') and len(self.app.data_log) > 0:
-                # Save to auto-save file
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                auto_save_path = f"logs/auto_save_{timestamp}.xlsx"
-                
+            if self._csv_file is not None:
 <<<<<<< HEAD
-                # Create logs directory if it doesn't exist
-                import os
-                os.makedirs("logs", exist_ok=True)
-                
-                # Save data directly to auto-save file
-                import pandas as pd
+                # Rows are already in the session CSV - hand them to the OS here,
+                # the slow fsync to disk runs on a pool thread
+                self._csv_file.flush()
+                self._sync_pool.start(lambda fd=self._csv_file.fileno(): self.sync_to_disk(fd))
                 
-                # Create enhanced data for export
-                export_data = []
-                for row_data in self.app.data_log:
-                    enhanced_row = list(row_data)
-                    
-                    # Convert lamp status to readable text
-                    if len(enhanced_row) >= 15:
-                        if hasattr(self.app, 'convert_lamp_status_to_text'):
-                            enhanced_row[13] = self.app.convert_lamp_status_to_text(enhanced_row[13])
-                            enhanced_row[14] = self.app.convert_lamp_status_to_text(enhanced_row[14])
-                    
-                    export_data.append(enhanced_row)
-                
-                # Create DataFrame
-                columns = [
-                    "Time", "Mode", "Heater", "Water Temp", "Target Temp", "Clean Mode", "Clean Hours", "Clean 3Min",
-                    "Eco Mode", "Heat LED", "Ready LED", "Eco LED", "Clean LED", "Current State", "Previous State", "Duration",
-                    "Heater State", "Heater Cmd", "Clean Mode Automation"
-                ]
-                df = pd.DataFrame(export_data)
-                if len(df.columns) == len(columns):
-                    df.columns = columns
-                
-                # Save to Excel
-                df.to_excel(auto_save_path, index=False, engine='openpyxl')
-                
-                print(f"💾 Auto-save completed: {auto_save_path}")
-                return auto_save_path
+                logger.info(f"💾 Auto-save completed: {self.csv_path}")
+                return self.csv_path
                 
         except Exception as e:
-            print(f"Auto-save error: {e}")
+            logger.error(f"Auto-save error: {e}")
             return None
 =======
-                saved_path = self.app.save_direct()
-                if saved_path:
-                    print(f"💾 Auto-save completed: {saved_path}")
+                self._csv_file.flush()
+                self._sync_pool.start(lambda fd=self._csv_file.fileno(): self.sync_to_disk(fd))
+                logger.info(f"💾 Auto-save completed: {self.csv_path}")
                 
         except Exception as e:
-            print(f"Auto-save error: {e}")
+            logger.error(f"Auto-save error: {e}")
 >>>>>>> 24a22cb66b502c59f5581b1d6de7b48f98ae3756
+    
+    def sync_to_disk(self, fd):
+        """fsync the session CSV (runs on a pool thread)"""
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.error(f"Auto-save sync error: {e}")
+    
+    def close(self):
+        """Flush and close the session CSV"""
+        if self._csv_file is not None:
+            self._sync_pool.waitForDone()  # No pending fsync on the descriptor
+            self._csv_file.flush()
+            os.fsync(self._csv_file.fileno())
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
 
 
 # Performance monitoring functions
 def get_system_info():
     """Get comprehensive system information"""
     try:
-        import platform
-        
         info = {
             'os': platform.system(),
             'os_version': platform.version(),
@@ -592,7 +686,7 @@ def get_system_info():
             'cpu_count': psutil.cpu_count(),
             'total_memory_gb': psutil.virtual_memory().total / (1024**3),
             'available_memory_gb': psutil.virtual_memory().available / (1024**3),
-            'cpu_percent': psutil.cpu_percent(interval=1),
+            'cpu_percent': psutil.cpu_percent(interval=None),  # Since the last call - non-blocking
         }
         
         return info
@@ -611,12 +705,16 @@ def optimize_matplotlib():
         
         # Reduce memory usage
         matplotlib.rcParams['figure.max_open_warning'] = 1
-        matplotlib.rcParams['agg.path.chunksize'] = 1000
+        matplotlib.rcParams['agg.path.chunksize'] = 10000
+        
+        # Let Agg simplify long lines instead of rasterizing them
+        matplotlib.rcParams['path.simplify'] = True
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
         
-        print("📈 Matplotlib optimized for performance")
+        logger.info("📈 Matplotlib optimized for performance")
         
     except Exception as e:
-        print(f"Matplotlib optimization error: {e}")
+        logger.error(f"Matplotlib optimization error: {e}")
 
 def check_dependencies():
     """Check if all dependencies are properly installed"""
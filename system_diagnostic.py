@@ -5,17 +5,36 @@ This script systematically checks all components and identifies issues
 
 import sys
 import os
+import importlib
+import importlib.util
 import traceback
 from datetime import datetime
 
-def print_header(title):
-    """Print diagnostic section header"""
-    print(f"\n{'='*60}")
-    print(f"🔍 {title}")
-    print(f"{'='*60}")
+from diagnostic_utils import cached_import, read_file_head, get_mock_app, problem_categories, print_header
 
-def test_imports():
-    """Test 1-4: Module Import Issues"""
+# The later tests use these modules, so they are really imported - the rest are only located with find_spec
+EXECUTED_MODULES = ("performance_optimization", "heater_monitor")
+
+def probe_import(module_name):
+    """Import or locate one module; returns the ImportError or None"""
+    try:
+        if module_name in EXECUTED_MODULES:
+            importlib.import_module(module_name)
+        elif importlib.util.find_spec(module_name) is None:
+            raise ImportError(f"No module named '{module_name}'")
+        return None
+    except ImportError as e:
+        return e
+
+def skip_problems(problem_nums, module_name):
+    """Report dependent problems as skipped instead of retrying a failed import"""
+    problems = [f"❌ Problem {n}: Skipped - {module_name} unavailable" for n in problem_nums]
+    for error_msg in problems:
+        print(error_msg)
+    return problems
+
+def test_imports(unavailable):
+    """Test 1-4: Module Import Issues - failed module names are added to unavailable"""
     print_header("TESTING MODULE IMPORTS")
     
     import_tests = [
@@ -33,35 +52,32 @@ def test_imports():
     
     problems = []
     for i, (module_name, description) in enumerate(import_tests, 1):
-        try:
-            __import__(module_name)
+        e = probe_import(module_name)
+        if e is None:
             print(f"✅ Problem {i}: {module_name} ({description}) - OK")
-        except ImportError as e:
+        else:
             error_msg = f"❌ Problem {i}: {module_name} - FAILED: {e}"
             print(error_msg)
             problems.append(error_msg)
+            unavailable.add(module_name)
     
     return problems
 
-def test_performance_optimization():
+def test_performance_optimization(unavailable):
     """Test 5-8: Performance Optimization Issues"""
     print_header("TESTING PERFORMANCE OPTIMIZATION")
     
-    problems = []
+    if 'performance_optimization' in unavailable:
+        return skip_problems(range(5, 9), 'performance_optimization')
     
-    # Define MockApp class for all tests
-    class MockApp:
-        def __init__(self):
-            self.timestamps = list(range(1000))  # 1000 data points
-            self.heater1_data = [25.0] * 1000
-            self.heater2_data = [30.0] * 1000
+    problems = []
     
-    mock_app = MockApp()
+    mock_app = get_mock_app()
     
     try:
         # Test 5: Chart Optimizer Data Point Limiting
         print("🧪 Test 5: Chart Data Point Limiting")
-        from performance_optimization import ChartOptimizer
+        ChartOptimizer = cached_import('performance_optimization', 'ChartOptimizer')
         optimizer = ChartOptimizer(mock_app)
         
         plot_timestamps, plot_heater1, plot_heater2 = optimizer.get_optimized_data_points()
@@ -81,9 +97,8 @@ def test_performance_optimization():
     try:
         # Test 6: Memory Monitoring
         print("🧪 Test 6: Memory Monitoring")
-        from performance_optimization import PerformanceOptimizer
+        PerformanceOptimizer = cached_import('performance_optimization', 'PerformanceOptimizer')
         
-        mock_app = MockApp()
         perf_optimizer = PerformanceOptimizer(mock_app)
         memory_usage = perf_optimizer.get_memory_usage()
         
@@ -102,7 +117,7 @@ def test_performance_optimization():
     try:
         # Test 7: Auto-Save Manager
         print("🧪 Test 7: Auto-Save Manager")
-        from performance_optimization import AutoSaveManager
+        AutoSaveManager = cached_import('performance_optimization', 'AutoSaveManager')
         
         auto_save = AutoSaveManager(mock_app)
         if hasattr(auto_save, 'auto_save_timer'):
@@ -120,7 +135,7 @@ def test_performance_optimization():
     try:
         # Test 8: Chart Redraw Logic
         print("🧪 Test 8: Chart Redraw Logic")
-        from performance_optimization import ChartOptimizer
+        ChartOptimizer = cached_import('performance_optimization', 'ChartOptimizer')
         optimizer = ChartOptimizer(mock_app)
         
         # Test redraw decision
@@ -142,16 +157,19 @@ def test_performance_optimization():
     
     return problems
 
-def test_main_application():
+def test_main_application(unavailable):
     """Test 9-10: Main Application Issues"""
     print_header("TESTING MAIN APPLICATION")
     
+    if 'heater_monitor' in unavailable:
+        return skip_problems((9, 10), 'heater_monitor')
+    
     problems = []
     
     try:
         # Test 9: Main App Import and Initialization
         print("🧪 Test 9: Main Application Import")
-        from heater_monitor import HeaterTestSystem
+        HeaterTestSystem = cached_import('heater_monitor', 'HeaterTestSystem')
         print("✅ Problem 9: HeaterTestSystem import successful")
         
     except Exception as e:
@@ -162,7 +180,7 @@ def test_main_application():
     try:
         # Test 10: Performance Integration
         print("🧪 Test 10: Performance Integration Check")
-        from heater_monitor import HAS_PERFORMANCE_OPT
+        HAS_PERFORMANCE_OPT = cached_import('heater_monitor', 'HAS_PERFORMANCE_OPT')
         if HAS_PERFORMANCE_OPT:
             print("✅ Problem 10: Performance optimization integration enabled")
         else:
@@ -177,14 +195,11 @@ def test_main_application():
     
     return problems
 
-def test_comprehensive_suite():
-    """Test 11-12: Comprehensive Test Suite Issues"""
-    print_header("TESTING COMPREHENSIVE TEST SUITE")
-    
+def test_comprehensive_import():
+    """Test 11: Comprehensive Tests Import"""
     problems = []
     
     try:
-        # Test 11: Comprehensive Tests Import
         print("🧪 Test 11: Comprehensive Tests Import")
         from comprehensive_tests import TestHeaterMonitorSystem
         print("✅ Problem 11: Comprehensive tests import successful")
@@ -194,24 +209,35 @@ def test_comprehensive_suite():
         print(error_msg)
         problems.append(error_msg)
     
+    return problems
+
+def test_comprehensive_suite(unavailable):
+    """Test 11-12: Comprehensive Test Suite Issues"""
+    print_header("TESTING COMPREHENSIVE TEST SUITE")
+    
+    # comprehensive_tests imports heater_monitor - Test 12 only reads a file
+    if 'heater_monitor' in unavailable:
+        problems = skip_problems((11,), 'heater_monitor')
+    else:
+        problems = test_comprehensive_import()
+    
     try:
         # Test 12: Chart Performance Test
         print("🧪 Test 12: Chart Performance Test Suite")
         
-        # Check if file exists and is readable
-        if os.path.exists("chart_performance_test_fixed.py"):
-            with open("chart_performance_test_fixed.py", 'r') as f:
-                content = f.read()
-                if "ChartPerformanceTest" in content:
-                    print("✅ Problem 12: Chart performance test suite available")
-                else:
-                    error_msg = "❌ Problem 12: Chart performance test class not found"
-                    print(error_msg)
-                    problems.append(error_msg)
-        else:
+        # Read the file directly - a missing file comes back as None
+        content = read_file_head("chart_performance_test_fixed.py")
+        
+        if content is None:
             error_msg = "❌ Problem 12: Chart performance test file missing"
             print(error_msg)
             problems.append(error_msg)
+        elif b"ChartPerformanceTest" in content:
+            print("✅ Problem 12: Chart performance test suite available")
+        else:
+            error_msg = "❌ Problem 12: Chart performance test class not found"
+            print(error_msg)
+            problems.append(error_msg)
             
     except Exception as e:
         error_msg = f"❌ Problem 12: Chart performance test check failed: {e}"
@@ -224,16 +250,17 @@ def main():
     """Main diagnostic function"""
     print("🚀 COMPREHENSIVE SYSTEM DIAGNOSTIC")
     print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"🐍 Python: {sys.version}")
+    print(f"🐍 Python: {'.'.join(map(str, sys.version_info[:3]))}")
     print(f"📁 Working Directory: {os.getcwd()}")
     
     all_problems = []
     
-    # Run all diagnostic tests
-    all_problems.extend(test_imports())
-    all_problems.extend(test_performance_optimization())
-    all_problems.extend(test_main_application())
-    all_problems.extend(test_comprehensive_suite())
+    # Run all diagnostic tests - later tests skip modules that already failed to import
+    unavailable = set()
+    all_problems.extend(test_imports(unavailable))
+    all_problems.extend(test_performance_optimization(unavailable))
+    all_problems.extend(test_main_application(unavailable))
+    all_problems.extend(test_comprehensive_suite(unavailable))
     
     # Final summary
     print_header("DIAGNOSTIC SUMMARY")
@@ -254,13 +281,14 @@ def main():
             print(f"  {i}. {problem}")
             
         print(f"\n💡 RECOMMENDED ACTIONS:")
-        if any("import" in p.lower() for p in all_problems):
+        categories = problem_categories(all_problems, ("import", "chart", "performance", "test"))
+        if "import" in categories:
             print("  - Install missing dependencies: pip install -r requirements.txt")
-        if any("chart" in p.lower() for p in all_problems):
+        if "chart" in categories:
             print("  - Fix chart optimization data point limiting")
-        if any("performance" in p.lower() for p in all_problems):
+        if "performance" in categories:
             print("  - Review performance optimization integration")
-        if any("test" in p.lower() for p in all_problems):
+        if "test" in categories:
             print("  - Fix test suite import/execution issues")
     else:
         print(f"\n🎉 ALL TESTS PASSED - SYSTEM IS STABLE!")
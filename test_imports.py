@@ -3,6 +3,9 @@
 Test script to verify all required modules can be imported
 """
 
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
 print("Testing module imports...")
 
 try:
@@ -17,41 +20,31 @@ try:
 except Exception as e:
     print(f"❌ PyQt6 import failed: {e}")
 
-try:
-    import numpy as np
-    print(f"✅ NumPy {np.__version__} imported successfully")
-except Exception as e:
-    print(f"❌ NumPy import failed: {e}")
-
-try:
-    import matplotlib
-    print(f"✅ Matplotlib {matplotlib.__version__} imported successfully")
-except Exception as e:
-    print(f"❌ Matplotlib import failed: {e}")
-
-try:
-    import pandas as pd
-    print(f"✅ Pandas {pd.__version__} imported successfully")
-except Exception as e:
-    print(f"❌ Pandas import failed: {e}")
-
-try:
-    import nidaqmx
-    print("✅ NI DAQmx imported successfully")
-except Exception as e:
-    print(f"❌ NI DAQmx import failed: {e}")
-
-try:
-    import openpyxl
-    print(f"✅ OpenPyXL {openpyxl.__version__} imported successfully")
-except Exception as e:
-    print(f"❌ OpenPyXL import failed: {e}")
-
-try:
-    import serial
-    print("✅ PySerial imported successfully")
-except Exception as e:
-    print(f"❌ PySerial import failed: {e}")
+# The remaining packages don't touch Qt - import them in parallel (import I/O releases the GIL)
+PACKAGES = [
+    ("numpy", "NumPy", True),
+    ("matplotlib", "Matplotlib", True),
+    ("pandas", "Pandas", True),
+    ("nidaqmx", "NI DAQmx", False),
+    ("openpyxl", "OpenPyXL", True),
+    ("serial", "PySerial", False),
+]
+
+def probe(module_name):
+    try:
+        return importlib.import_module(module_name), None
+    except Exception as e:
+        return None, e
+
+with ThreadPoolExecutor(max_workers=len(PACKAGES)) as executor:
+    results = list(executor.map(probe, [module_name for module_name, _, _ in PACKAGES]))
+
+for (module_name, label, show_version), (module, error) in zip(PACKAGES, results):
+    if error is None:
+        version = f" {module.__version__}" if show_version else ""
+        print(f"✅ {label}{version} imported successfully")
+    else:
+        print(f"❌ {label} import failed: {error}")
 
 print("\n" + "="*50)
 print("Import test completed!")